@@ -1,50 +1,88 @@
-import argparse
 import logging
-import os
+import sys
+from collections.abc import Sequence
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 
-from icon_manager.config.app import AppConfig, AppConfigFactory
-from icon_manager.data.json_source import JsonSource
-from icon_manager.helpers.logs import log_time
-from icon_manager.helpers.resource import app_config_template_file
-from icon_manager.interfaces.path import ConfigFile
-from icon_manager.rules.factory.manager import ExcludeManagerFactory
-from icon_manager.services.app_service import IconsAppService
+# The application modules are imported where they are needed, so that
+# parsing the arguments and printing the help only loads the stdlib.
+if TYPE_CHECKING:
+    import argparse
+
+    from icon_manager.config.app import AppConfig
+    from icon_manager.interfaces.path import ConfigFile
+    from icon_manager.services.app_service import IconsAppService
 
 log = logging.getLogger(__name__)
 
+# format_string = '%(levelname)-8s: %(name)-12s: %(funcName)s - %(message)s'
+# format_string = '%(levelname)-8s %(funcName)-30s>> %(message)s'
+_FORMATTER = logging.Formatter("%(levelname)-8s  %(message)s")
+
 
 def console(level) -> logging.Handler:
     handler = logging.StreamHandler()
     handler.setLevel(level)
-    # format_string = '%(levelname)-8s: %(name)-12s: %(funcName)s - %(message)s'
-    # format_string = '%(levelname)-8s %(funcName)-30s>> %(message)s'
-    format_string = "%(levelname)-8s  %(message)s"
-    formatter = logging.Formatter(format_string)
-    handler.setFormatter(formatter)
-    return handler
-
-
-def log_file(level) -> logging.Handler:
-    file_path = os.path.join(os.getcwd(), "icon_manager.log")
-    handler = RotatingFileHandler(filename=file_path, mode="a", maxBytes=10240, backupCount=3, encoding="UTF-8")
-    handler.setLevel(level)
-    # formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(message)s',
-    #                               '%d-%b-%y %H:%M:%S')
-    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(message)s", "%d-%b-%y %H:%M:%S")
-    handler.setFormatter(formatter)
+    handler.setFormatter(_FORMATTER)
     return handler
 
 
 def config_logger(level):
+    if logging.getLogger().handlers:
+        return
     logging.basicConfig(handlers=[console(level)], level=level)
     logger = logging.getLogger("Icon Manager Logger")
-    # logger.addHandler(log_file(logging.DEBUG))
     logger.info("Logger configured")
 
 
-def get_namespace_from_args() -> argparse.Namespace:
+# Keep in sync with the arguments of the parser in create_parser
+_SWITCHES = {
+    "--library": "library",
+    "-l": "library",
+    "--content": "content",
+    "-c": "content",
+    "--create": "create",
+    "-a": "create",
+    "--re-create": "re_create",
+    "-r": "re_create",
+    "--update": "update",
+    "-u": "update",
+    "--delete": "delete",
+    "-d": "delete",
+    "--archive": "archive",
+    "-v": "archive",
+    "--verbose": "verbose",
+}
+_INT_OPTIONS = {"--jobs": "jobs", "-j": "jobs"}
+
+
+def namespace_from_argv(args: Sequence[str]) -> SimpleNamespace | None:
+    """Scans the arguments without building the argparse parser.
+
+    Returns None for everything the scan does not understand (help, unknown or
+    malformed arguments), so the parser can handle it with its usual messages.
+    """
+    values = dict.fromkeys(_SWITCHES.values(), False)
+    values["jobs"] = None
+    tokens = iter(args)
+    for token in tokens:
+        if token in _SWITCHES:
+            values[_SWITCHES[token]] = True
+            continue
+        if token not in _INT_OPTIONS:
+            return None
+        value = next(tokens, None)
+        # isdigit also accepts digits like "²", which int() rejects
+        if value is None or not value.isdecimal():
+            return None
+        values[_INT_OPTIONS[token]] = int(value)
+    return SimpleNamespace(**values)
+
+
+def create_parser() -> "argparse.ArgumentParser":
+    import argparse
+
     description = "Helper to add icons to folders defined in a external JSON file."
     parser = argparse.ArgumentParser(description=description)
     parser.add_argument(
@@ -90,18 +128,49 @@ def get_namespace_from_args() -> argparse.Namespace:
         action="store_true",
         help='Moves the library configs without rules into subfolder "archive"',
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Maximal number of threads used to write or delete content. 1 runs serially. "
+        "Defaults to 4 per CPU, at most 32",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Log every single folder an icon is applied to",
+    )
+    return parser
+
 
+def get_namespace_from_args(args: Sequence[str] | None = None) -> "SimpleNamespace | argparse.Namespace":
+    if args is None:
+        args = sys.argv[1:]
+    namespace = namespace_from_argv(args)
+    if namespace is None:
+        return create_parser().parse_args(args)
+    return namespace
 
-def get_app_config(config_file: ConfigFile) -> AppConfig:
-    exclude_factory = ExcludeManagerFactory(JsonSource())
-    factory = AppConfigFactory(JsonSource(), exclude_factory)
+
+def get_app_config(config_file: "ConfigFile") -> "AppConfig":
+    from icon_manager.config.app import AppConfigFactory
+    from icon_manager.data.json_source import JsonSource
+    from icon_manager.rules.factory.manager import ExcludeManagerFactory
+
+    source = JsonSource()
+    exclude_factory = ExcludeManagerFactory(source)
+    factory = AppConfigFactory(source, exclude_factory)
     config = factory.create(config_file)
     config.validate()
     return config
 
 
-def get_service() -> IconsAppService:
+def get_service() -> "IconsAppService":
+    from icon_manager.config.app import AppConfigFactory
+    from icon_manager.helpers.resource import app_config_template_file
+    from icon_manager.services.app_service import IconsAppService
+
     app_config = AppConfigFactory.app_config_file()
     if not app_config.exists():
         app_template = app_config_template_file()
@@ -111,9 +180,15 @@ def get_service() -> IconsAppService:
     return service
 
 
-def main():
-    config_logger(logging.INFO)
-    namespace = get_namespace_from_args()
+def main(namespace: "SimpleNamespace | argparse.Namespace | None" = None):
+    if namespace is None:
+        namespace = get_namespace_from_args()
+    config_logger(logging.DEBUG if namespace.verbose else logging.INFO)
+    from icon_manager.helpers.logs import log_time
+    from icon_manager.interfaces import actions
+
+    if namespace.jobs is not None:
+        actions.MAX_WORKERS = max(1, namespace.jobs)
     start_time = datetime.now()
     service = get_service()
     service.setup()
@@ -1,15 +1,19 @@
 import copy
 import logging
 import os
+import pickle
+import sys
 from collections.abc import Collection, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Collection, Dict, Iterable, List, Optional, Sequence
+from functools import lru_cache
+from typing import Any, Collection, Dict, Iterable, Optional, Sequence
 
 from icon_manager.config.base import Config
 from icon_manager.config.user import UserConfig, UserConfigFactory
 from icon_manager.data.json_source import JsonSource
 from icon_manager.helpers.environment import get_converted_env_path
-from icon_manager.helpers.path import get_files
+from icon_manager.helpers.path import iter_files
 from icon_manager.helpers.resource import app_config_template_file
 from icon_manager.helpers.user_inputs import (
     ask_user,
@@ -23,12 +27,12 @@ from icon_manager.rules.manager import ExcludeManager
 
 log = logging.getLogger(__name__)
 
-
-def get_paths(path: str, names: Iterable[str]) -> List[str]:
-    return [os.path.join(path, name) for name in names]
+USER_CONFIG_WORKERS: int = 8
 
 
 class AppConfig(Config):
+    __slots__ = ("_exclude_rules", "user_configs", "before_or_after")
+
     def __init__(
         self,
         user_configs: Iterable[UserConfig],
@@ -41,8 +45,14 @@ class AppConfig(Config):
         self.before_or_after = before_or_after
 
     def create_exclude_rules(self) -> ExcludeManager:
-        rule_copy = copy.deepcopy(self._exclude_rules)
-        return rule_copy
+        # Every service sets up and cleans its own copy of the rules.
+        # A pickle round trip clones the acyclic rule tree much faster
+        # than deepcopy, which stays as fallback for unpicklable rules.
+        try:
+            data = pickle.dumps(self._exclude_rules, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return copy.deepcopy(self._exclude_rules)
+        return pickle.loads(data)
 
     def validate(self):
         for user_config in self.user_configs:
@@ -54,11 +64,18 @@ class AppConfigs(str, Enum):
     BEFORE_OR_AFTER = "before_or_after"
 
 
+# Plain interned keys for the lookups in the JSON content; they also keep
+# enum members out of the dict that is written back to the app config.
+USER_CONFIGS = sys.intern(AppConfigs.USER_CONFIGS.value)
+BEFORE_OR_AFTER = sys.intern(AppConfigs.BEFORE_OR_AFTER.value)
+
+
 class AppConfigFactory(FileFactory[ConfigFile, AppConfig]):
     APP_CONFIG_NAME = "app_config.config"
     EXCLUDE_NAME = "excluded_rules.config"
 
     @classmethod
+    @lru_cache(maxsize=4)
     def app_config_path(cls, folder_path: str = "%APPDATA%/Icon-Manager") -> str:
         folder_path = get_converted_env_path(folder_path)
         if not os.path.isdir(folder_path):
@@ -77,17 +94,15 @@ class AppConfigFactory(FileFactory[ConfigFile, AppConfig]):
 
     @classmethod
     def get_user_config_paths(cls, folder_path: str) -> Collection[str]:
-        names = get_files(folder_path, ConfigFile.extension())
-        names = list(filter(lambda name: cls.is_user_config_name(name), names))
-        return get_paths(folder_path, names)
+        entries = iter_files(folder_path, ConfigFile.extension())
+        return [entry.path for entry in entries if cls.is_user_config_name(entry.name)]
 
     @classmethod
     def get_exclude_config(cls, folder_path: str) -> str | None:
-        names = get_files(folder_path, ConfigFile.extension())
-        names = list(filter(lambda name: cls.EXCLUDE_NAME == name, names))
-        if len(names) != 1:
+        config_path = os.path.join(folder_path, cls.EXCLUDE_NAME)
+        if not os.path.isfile(config_path):
             return None
-        return os.path.join(folder_path, names[0])
+        return config_path
 
     def __init__(self, source: JsonSource, factory: ExcludeManagerFactory) -> None:
         self.source = source
@@ -101,14 +116,14 @@ class AppConfigFactory(FileFactory[ConfigFile, AppConfig]):
         return self.__class__.get_exclude_config(config_folder)
 
     def is_user_config_path_empty(self, config_folder: str) -> bool:
-        return len(config_folder) == 0
+        return not config_folder
 
     def does_user_config_path_exists(self, config_folder: str) -> bool:
         return os.path.isdir(config_folder)
 
     def does_user_configs_exists(self, config_folder: str) -> bool:
         config_files = self._get_user_config_paths(config_folder)
-        return len(config_files) > 0
+        return bool(config_files)
 
     def ask_user_for_config_path(self, information: str | None) -> str:
         message = "Please enter path for all user configurations: "
@@ -118,7 +133,7 @@ class AppConfigFactory(FileFactory[ConfigFile, AppConfig]):
     def ask_user_for_config_file_name(self) -> str:
         message = "Enter new user configuration file name (/wo extension) "
         file_name = ask_user(message)
-        if len(file_name) == 0:
+        if not file_name:
             return self.ask_user_for_config_file_name()
         return file_name
 
@@ -149,12 +164,19 @@ class AppConfigFactory(FileFactory[ConfigFile, AppConfig]):
             return
         self.excluded_factory.create_template(config)
 
+    def _create_user_configs(self, config_files: Sequence[ConfigFile]) -> list[UserConfig]:
+        # Every user config is read and parsed on its own, load them concurrently
+        if len(config_files) < 2:
+            return [self.user_factory.create(config_file) for config_file in config_files]
+        workers = min(USER_CONFIG_WORKERS, len(config_files))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="user config") as executor:
+            return list(executor.map(self.user_factory.create, config_files))
+
     def create_user_configs(self, content: dict[str, Any]) -> Sequence[UserConfig]:
-        config_folder_path = content[AppConfigs.USER_CONFIGS]
+        config_folder_path = content[USER_CONFIGS]
+        config_files = [ConfigFile(path) for path in self._get_user_config_paths(config_folder_path)]
         user_configs = []
-        for config_file_path in self._get_user_config_paths(config_folder_path):
-            user_config_file = ConfigFile(config_file_path)
-            user_config = self.user_factory.create(user_config_file)
+        for user_config_file, user_config in zip(config_files, self._create_user_configs(config_files), strict=True):
             if not user_config.has_search_folders():
                 config_name = user_config_file.name_wo_extension
                 message = f'No valid search folder in "{config_name}" []'
@@ -164,7 +186,7 @@ class AppConfigFactory(FileFactory[ConfigFile, AppConfig]):
         return user_configs
 
     def create_exclude_config(self, content: dict[str, Any]) -> ExcludeManager:
-        config_folder = content[AppConfigs.USER_CONFIGS]
+        config_folder = content[USER_CONFIGS]
         config_path = self._get_exclude_config_path(config_folder)
         if config_path is None:
             return ExcludeManager([])
@@ -175,7 +197,7 @@ class AppConfigFactory(FileFactory[ConfigFile, AppConfig]):
             template_file = app_config_template_file()
             template_file.copy_to(file)
         content = self.source.read(file, **kwargs)
-        config_folder_path = content.get(AppConfigs.USER_CONFIGS, "")
+        config_folder_path = content.get(USER_CONFIGS, "")
         if self.is_user_config_path_empty(config_folder_path):
             information = "No path for the user configuration exists"
             config_folder_path = self.ask_user_for_config_path(information)
@@ -184,11 +206,12 @@ class AppConfigFactory(FileFactory[ConfigFile, AppConfig]):
             config_folder_path = self.ask_user_for_config_path(information)
         if not self.does_user_configs_exists(config_folder_path):
             self.ask_user_if_not_any_config_file_exist(config_folder_path)
-        content[AppConfigs.USER_CONFIGS] = config_folder_path
-        self.source.write(file, content)
+        if content.get(USER_CONFIGS) != config_folder_path:
+            content[USER_CONFIGS] = config_folder_path
+            self.source.write(file, content)
         user_configs = self.create_user_configs(content)
-        if len(user_configs) == 0:
+        if not user_configs:
             raise ValueError("No valid user configuration exists")
         exclude_rules = self.create_exclude_config(content)
-        before_or_after = content.get(AppConfigs.BEFORE_OR_AFTER, [])
+        before_or_after = content.get(BEFORE_OR_AFTER, ())
         return AppConfig(user_configs, exclude_rules, before_or_after)
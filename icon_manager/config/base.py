@@ -2,4 +2,6 @@ from typing import Protocol
 
 
 class Config(Protocol):
+    __slots__ = ()
+
     def validate(self): ...
@@ -1,5 +1,8 @@
 import logging
-from collections.abc import Iterable, Sequence
+import os
+import sys
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from enum import StrEnum
 from typing import Any
 from uuid import uuid4
@@ -19,8 +22,23 @@ from icon_manager.interfaces.path import (
 
 log = logging.getLogger(__name__)
 
+EXISTS_WORKERS: int = 16
+
 
 class UserConfig(Config):
+    __slots__ = (
+        "uuid",
+        "name",
+        "icons_path",
+        "search_folders",
+        "code_folders",
+        "exclude_folders",
+        "before_or_after",
+        "copy_icon",
+        "_search_roots",
+        "_search_roots_of",
+    )
+
     @classmethod
     def file_name(cls) -> str:
         return "*.config"
@@ -44,21 +62,31 @@ class UserConfig(Config):
         self.exclude_folders = exclude_folders
         self.before_or_after: set[str] = set(before_or_after)
         self.copy_icon = copy_icon
+        self._search_roots: tuple[tuple[str, IconSearchFolder], ...] = ()
+        self._search_roots_of: Sequence[IconSearchFolder] | None = None
 
     def validate(self):
-        filters.EXCLUDED_FOLDERS = self.exclude_folders
-        filters.PROJECT_FOLDERS = self.code_folders
+        filters.EXCLUDED_FOLDERS = frozenset(self.exclude_folders)
+        filters.PROJECT_FOLDERS = frozenset(self.code_folders)
 
     def has_search_folders(self) -> bool:
-        return len(self.search_folders) > 0
+        return bool(self.search_folders)
 
     def search_folder_by(self, entry: PathModel) -> IconSearchFolder:
-        for search_folder in self.search_folders:
-            if not search_folder.is_path_entry(entry):
-                continue
-            return search_folder
+        path = os.path.normcase(entry.path)
+        for root, search_folder in self.__search_roots():
+            if path.startswith(root):
+                return search_folder
         raise ValueError(f"Search folder for {entry.path} not exists")
 
+    def __search_roots(self) -> tuple[tuple[str, IconSearchFolder], ...]:
+        # Longest path first, so nested search folders win over their parents
+        if self._search_roots_of is not self.search_folders:
+            roots = ((os.path.normcase(folder.path), folder) for folder in self.search_folders)
+            self._search_roots = tuple(sorted(roots, key=lambda root: len(root[0]), reverse=True))
+            self._search_roots_of = self.search_folders
+        return self._search_roots
+
 
 class UserConfigs(StrEnum):
     CONFIG_SECTION = "config"
@@ -71,39 +99,86 @@ class UserConfigs(StrEnum):
     BEFORE_OR_AFTER = "before_or_after"
 
 
+# Plain interned keys for the lookups in the JSON content
+CONFIG_SECTION = sys.intern(UserConfigs.CONFIG_SECTION.value)
+CODE_FOLDERS = sys.intern(UserConfigs.CODE_FOLDERS.value)
+EXCLUDE_FOLDERS = sys.intern(UserConfigs.EXCLUDE_FOLDERS.value)
+SEARCH_FOLDERS = sys.intern(UserConfigs.SEARCH_FOLDERS.value)
+SEARCH_PATH = sys.intern(UserConfigs.SEARCH_PATH.value)
+ICONS_PATH = sys.intern(UserConfigs.ICONS_PATH.value)
+COPY_ICONS = sys.intern(UserConfigs.COPY_ICONS.value)
+BEFORE_OR_AFTER = sys.intern(UserConfigs.BEFORE_OR_AFTER.value)
+
+
 def get_icons_path(file: ConfigFile, content: dict[str, Any]) -> SearchFolder:
-    icons_path = content.get(UserConfigs.ICONS_PATH, None)
+    icons_path = content.get(ICONS_PATH, None)
     if icons_path is None:
         raise ValueError(f"Icon path DOES NOT exists in {file.path}")
     return SearchFolder(get_converted_env_path(icons_path))
 
 
 def get_icons_search_folder(content: dict[str, Any]) -> IconSearchFolder:
-    search_path = content.get(UserConfigs.SEARCH_PATH, None)
+    search_path = content.get(SEARCH_PATH, None)
     if search_path is None:
         raise ValueError("NO path for search folders found")
     search_path = get_converted_env_path(search_path)
-    icon_copy = content.get(UserConfigs.COPY_ICONS, None)
+    icon_copy = content.get(COPY_ICONS, None)
     return IconSearchFolder(search_path, icon_copy)
 
 
+def _exists_all(folders: Sequence[IconSearchFolder]) -> list[bool]:
+    # Search folders are often on network or OneDrive paths, check them concurrently
+    if len(folders) < 2:
+        return [folder.exists() for folder in folders]
+    workers = min(EXISTS_WORKERS, len(folders))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="search folder") as executor:
+        return list(executor.map(lambda folder: folder.exists(), folders))
+
+
 def get_search_folders(file: ConfigFile, content: dict[str, Any]) -> Sequence[IconSearchFolder]:
-    search_folder_configs = content.get(UserConfigs.SEARCH_FOLDERS, None)
+    search_folder_configs = content.get(SEARCH_FOLDERS, None)
     if search_folder_configs is None:
         raise ValueError(f"Search folders DOES NOT exists in {file.path}")
-    if not isinstance(search_folder_configs, list) or len(search_folder_configs) == 0:
+    if not isinstance(search_folder_configs, list) or not search_folder_configs:
         raise ValueError(f"Search folders specified in {file.path}")
-    search_folders = []
+    candidates = []
     for folder_config in search_folder_configs:
         if not isinstance(folder_config, dict):
             raise ValueError("Search folder config is a list of Dicts")
-        icon_search = get_icons_search_folder(folder_config)
-        if not icon_search.exists():
-            message = f"{icon_search.name} does not exists [{icon_search.path}]"
-            log.info(message)
+        candidates.append(get_icons_search_folder(folder_config))
+    search_folders = []
+    for icon_search, exists in zip(candidates, _exists_all(candidates), strict=True):
+        if not exists:
+            log.info("%s does not exists [%s]", icon_search.name, icon_search.path)
             continue
         search_folders.append(icon_search)
-    return search_folders
+    # Resolved once per config, the services only iterate the search folders
+    return tuple(search_folders)
+
+
+_TEMPLATE_SECTIONS = frozenset(
+    {
+        SEARCH_FOLDERS,
+        BEFORE_OR_AFTER,
+        ICONS_PATH,
+        COPY_ICONS,
+    }
+)
+# Value type -> factory of the empty value, sections of other types are dropped
+_EMPTY_TEMPLATE_VALUES: dict[type, Callable[[], Any]] = {str: str, list: list, bool: bool}
+
+
+def _cleaned_template_section(configs: dict[str, Any]) -> dict[str, Any]:
+    cleaned = {}
+    for section, values in configs.items():
+        if section not in _TEMPLATE_SECTIONS:
+            cleaned[section] = values
+            continue
+        empty_value = _EMPTY_TEMPLATE_VALUES.get(type(values))
+        if empty_value is None:
+            continue
+        cleaned[section] = empty_value()
+    return cleaned
 
 
 class UserConfigFactory(FileFactory[ConfigFile, UserConfig]):
@@ -112,13 +187,13 @@ class UserConfigFactory(FileFactory[ConfigFile, UserConfig]):
 
     def create(self, file: ConfigFile, **kwargs) -> UserConfig:
         content = self.source.read(file, **kwargs)
-        content = content.get(UserConfigs.CONFIG_SECTION, {})
+        content = content.get(CONFIG_SECTION, {})
         icons_path = get_icons_path(file, content)
         search_folders = get_search_folders(file, content)
-        copy_icon = content.get(UserConfigs.COPY_ICONS, False)
-        before_or_after = content.get(UserConfigs.BEFORE_OR_AFTER, [])
-        code_folders = content.get(UserConfigs.CODE_FOLDERS, [])
-        exclude_folders = content.get(UserConfigs.EXCLUDE_FOLDERS, [])
+        copy_icon = content.get(COPY_ICONS, False)
+        before_or_after = content.get(BEFORE_OR_AFTER, ())
+        code_folders = content.get(CODE_FOLDERS, ())
+        exclude_folders = content.get(EXCLUDE_FOLDERS, ())
         config_name = file.name
         return UserConfig(
             config_name,
@@ -138,24 +213,9 @@ class UserConfigFactory(FileFactory[ConfigFile, UserConfig]):
         content = self.source.read(user_config)
         if content is None:
             raise RuntimeError("Should not be possible")
-        chaining_configs = [
-            UserConfigs.SEARCH_FOLDERS,
-            UserConfigs.BEFORE_OR_AFTER,
-            UserConfigs.ICONS_PATH,
-            UserConfigs.COPY_ICONS,
-        ]
-        configs = content.get(UserConfigs.CONFIG_SECTION, {})
-        for section, values in configs.items():
-            if section not in chaining_configs:
-                continue
-            if isinstance(values, str):
-                content[UserConfigs.CONFIG_SECTION][section] = ""
-            elif isinstance(values, list):
-                content[UserConfigs.CONFIG_SECTION][section] = []
-            elif isinstance(values, bool):
-                content[UserConfigs.CONFIG_SECTION][section] = False
-            else:
-                content[UserConfigs.CONFIG_SECTION].pop(section)
+        configs = content.get(CONFIG_SECTION)
+        if configs is not None:
+            content[CONFIG_SECTION] = _cleaned_template_section(configs)
         self.source.write(user_config, content)
 
     def create_template(self, user_config: ConfigFile) -> ConfigFile:
@@ -1,4 +1,5 @@
 import logging
+import os
 from typing import Sequence
 from collections.abc import Iterable
 
@@ -10,31 +11,55 @@ from icon_manager.interfaces.actions import Action
 
 log = logging.getLogger(__name__)
 
+# DesktopIniCreator keeps no state per folder, all actions share one instance
+_DEFAULT_INI_CREATOR = DesktopIniCreator()
+
 
 class CreateIconAction(Action[MatchedRuleFolder]):
 
     def __init__(self, entries: Sequence[MatchedRuleFolder], user_config: UserConfig,
-                 action_log: str = 'Added Icons to Folders', controller: DesktopIniCreator = DesktopIniCreator()) -> None:
+                 action_log: str = 'Added Icons to Folders', controller: DesktopIniCreator | None = None) -> None:
         super().__init__(user_config, entries, action_log)
         self.user_config = user_config
-        self.controller = controller
+        self.controller = controller or _DEFAULT_INI_CREATOR
+        self._done: set[str] = set()
+
+    def is_first_visit(self, entry: MatchedRuleFolder) -> bool:
+        """Every folder is written once per run, even if it is matched multiple times."""
+        key = os.path.normcase(entry.path)
+        with self._lock:
+            if key in self._done:
+                return False
+            self._done.add(key)
+        return True
 
     def can_execute(self, entry: MatchedRuleFolder) -> bool:
+        if not self.is_first_visit(entry):
+            return False
         if not entry.desktop_ini.exists():
             return True
         can_write = self.controller.can_write(entry.desktop_ini)
         if not can_write:
-            log.warning(f'Can not write desktop.ini in "{entry.path}"')
+            log.warning('Can not write desktop.ini in "%s"', entry.path)
         return can_write
 
-    def execute_action(self, entry: MatchedRuleFolder) -> None:
+    def copy_icon_of(self, entry: MatchedRuleFolder) -> bool:
         search_folder = self.user_config.search_folder_by(entry)
         copy_icon = search_folder.copy_icon
         if copy_icon is None:
             copy_icon = self.user_config.copy_icon
         if entry.setting.copy_icon is not None:
             copy_icon = entry.setting.copy_icon
-        self.controller.write(entry, copy_icon)
+        return copy_icon
+
+    def execute(self) -> None:
+        # Serial runs write all folders phase by phase, see DesktopIniCreator.write_many
+        writes = [(entry, self.copy_icon_of(entry))
+                  for entry in self.entries if self.accept_entry(entry)]
+        self.controller.write_many(writes)
+
+    def execute_action(self, entry: MatchedRuleFolder) -> None:
+        self.controller.write(entry, self.copy_icon_of(entry))
 
     def get_log_message(self, model: type) -> str:
         name = self._log_prefix(model)
@@ -48,10 +73,11 @@ class ReCreateIconAction(CreateIconAction):
         self,
         re_apply: ReApplyController,
         user_config: UserConfig,
-        controller: DesktopIniCreator = DesktopIniCreator(),
+        controller: DesktopIniCreator | None = None,
     ) -> None:
         super().__init__(
-            re_apply.get_rule_folders(),
+            # The action needs the number of folders to size its thread pool
+            list(re_apply.get_rule_folders()),
             user_config,
             action_log="Re added Icons to folder",
             controller=controller,
@@ -1,7 +1,8 @@
 import logging
-import threading
+import os
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Sequence
+from functools import lru_cache
 
 from icon_manager.config.user import UserConfig
 from icon_manager.content.controller.base import ContentController
@@ -12,8 +13,9 @@ from icon_manager.content.models.matched import (
     MatchedRuleFolder,
 )
 from icon_manager.crawler.filters import files_by_extension
-from icon_manager.data.ini_source import DesktopFileSource
+from icon_manager.data.ini_source import DesktopFileSource, has_line
 from icon_manager.helpers.decorator import execution, execution_action
+from icon_manager.helpers.throttle import log_exception_once
 from icon_manager.interfaces.actions import Action, DeleteAction
 from icon_manager.interfaces.builder import FileCrawlerBuilder
 from icon_manager.interfaces.path import File, Folder, PathModel
@@ -24,6 +26,21 @@ log = logging.getLogger(__name__)
 
 # region MATCHED DESKTOP INI
 
+APP_ENTRY = "IconManager=1"
+# The entry is ASCII, the same bytes in every ANSI code page desktop.ini is written in
+APP_ENTRY_BYTES = APP_ENTRY.encode("ascii")
+
+# is_app_file results are keyed by path, mtime and size. The crawler, the delete
+# and the create action check the same desktop.ini files, a write or delete
+# changes the key and the outdated entry is evicted as least recently used.
+APP_FILE_CACHE_SIZE = 4096
+# Larger files are searched memory mapped, smaller ones are faster read at once
+MMAP_MIN_SIZE = 4096
+
+# The source keeps no state, the default builder and creator share it and
+# one checker, so the crawl and the create action hit the same cache entries
+_DEFAULT_SOURCE = DesktopFileSource()
+
 
 class DesktopFileChecker:
     def __init__(self, source: DesktopFileSource) -> None:
@@ -34,20 +51,47 @@ class DesktopFileChecker:
             source_file = file
         else:
             source_file = DesktopIniFile(file.path)
-        content_lines = self.source.read(source_file)
-        for line in content_lines:
-            if DesktopIniBuilder.app_entry not in line:
-                continue
-            return True
-        return False
+        try:
+            stat = os.stat(source_file.path)
+        except OSError:
+            return _read_is_app_file(self.source, source_file)
+        return _is_app_file_cached(self.source, source_file.path, stat.st_mtime_ns, stat.st_size)
+
+
+_DEFAULT_CHECKER = DesktopFileChecker(_DEFAULT_SOURCE)
+
+
+def _checker_for(source: DesktopFileSource | None) -> DesktopFileChecker:
+    if source is None or source is _DEFAULT_SOURCE:
+        return _DEFAULT_CHECKER
+    return DesktopFileChecker(source)
+
+
+def is_app_content(content: bytes) -> bool:
+    return has_line(content, APP_ENTRY_BYTES)
+
+
+def _read_is_app_file(source: DesktopFileSource, source_file: DesktopIniFile) -> bool:
+    return is_app_content(source.read_bytes(source_file))
+
+
+@lru_cache(maxsize=APP_FILE_CACHE_SIZE)
+def _is_app_file_cached(source: DesktopFileSource, path: str, mtime_ns: int, size: int) -> bool:
+    source_file = DesktopIniFile(path)
+    if size > MMAP_MIN_SIZE:
+        # The line is checked in the mapped file, the file is not read a second time
+        return source.contains_line(source_file, APP_ENTRY_BYTES)
+    return _read_is_app_file(source, source_file)
 
 
 class DesktopIniBuilder(FileCrawlerBuilder[DesktopIniFile]):
-    app_entry = "IconManager=1"
+    app_entry = APP_ENTRY
+    # Every file is read, overlap the reads for larger crawls
+    parallel_threshold = 64
 
-    def __init__(self, source: DesktopFileSource) -> None:
+    def __init__(self, source: DesktopFileSource | None = None) -> None:
         super().__init__()
-        self.checker = DesktopFileChecker(source)
+        self.checker = _checker_for(source)
 
     def can_build_file(self, file: File, **kwargs) -> bool:
         return DesktopIniFile.is_model(file.path) and self.checker.is_app_file(file)
@@ -56,38 +100,28 @@ class DesktopIniBuilder(FileCrawlerBuilder[DesktopIniFile]):
         return DesktopIniFile(file.path)
 
 
-class DesktopDeleteAction(DeleteAction):
-
-    def __init__(self, config: Optional[UserConfig], entries: Sequence[PathModel], checker: DesktopFileChecker) -> None:
-        super().__init__(config, entries)
-        self.checker = checker
-
-    def can_execute(self, entry: PathModel) -> bool:
-        can_execute = super().can_execute(entry)
-        return can_execute and self.checker.is_app_file(entry)
+_DESKTOP_EXTENSIONS = (DesktopIniFile.extension(with_point=False),)
 
 
 class DesktopIniController(ContentController[DesktopIniFile]):
     def __init__(
         self,
         user_config: UserConfig,
-        builder: DesktopIniBuilder = DesktopIniBuilder(DesktopFileSource()),
+        builder: DesktopIniBuilder | None = None,
     ) -> None:
-        super().__init__(user_config, builder)
+        super().__init__(user_config, builder or DesktopIniBuilder())
         self.desktop_files: list[DesktopIniFile] = []
 
     @execution(message="Crawle & build DESKTOP.INI-files")
     def crawle_and_build_result(self, folders: list[Folder], _: Sequence[IconSetting]):
-        extensions = [DesktopIniFile.extension(with_point=False)]
-        files = files_by_extension(folders, extensions)
+        files = files_by_extension(folders, _DESKTOP_EXTENSIONS)
         self.desktop_files = self.builder.build_models(files)
 
     @execution_action(message='Deleted DESKTOP.INI-files')
     def delete_content(self) -> Action:
-        checker = DesktopFileChecker(DesktopFileSource())
-        action = DesktopDeleteAction(self.user_config, self.desktop_files,
-                                     checker)
-        action.execute()
+        # The builder only builds desktop.ini files written by the app, no need to read them again
+        action = DeleteAction(self.user_config, self.desktop_files)
+        action.async_execute()
         if not action.any_executed():
             return action
         return action
@@ -99,14 +133,24 @@ class DesktopIniController(ContentController[DesktopIniFile]):
 # region COMMANDS
 
 
-lock = threading.Lock()
-
-
 class ConfigCommand(ABC):
+    # Four commands are created for every written folder
+    __slots__ = ("order", "copy_icon", "_exists")
+
     def __init__(self, order: int, copy_icon: bool) -> None:
         super().__init__()
         self.order = order
         self.copy_icon = copy_icon
+        self._exists: bool | None = None
+
+    def target_exists(self, target: PathModel) -> bool:
+        """Checks the existence of the target once, the commands update it themselves."""
+        if self._exists is None:
+            self._exists = target.exists()
+        return self._exists
+
+    def log_error(self, model: PathModel, message: str, ex: Exception) -> None:
+        log_exception_once(log, type(self).__name__, error_message(model, message), ex)
 
     @abstractmethod
     def pre_command(self):
@@ -125,6 +169,8 @@ def error_message(model: PathModel, message: str) -> str:
 
 
 class RuleFolderCommand(ConfigCommand):
+    __slots__ = ("rule_folder",)
+
     def __init__(self, order: int, copy_icon: bool, rule_folder: MatchedRuleFolder) -> None:
         super().__init__(order, copy_icon)
         self.rule_folder = rule_folder
@@ -142,8 +188,7 @@ class RuleFolderCommand(ConfigCommand):
         try:
             self.rule_folder.icon_folder.create()
         except Exception as ex:
-            message = "icon folder create [pre command]"
-            log.exception(error_message(self.rule_folder, message), ex)
+            self.log_error(self.rule_folder, "icon folder create [pre command]", ex)
 
     def post_command(self):
         if not self.can_change_attribute():
@@ -151,35 +196,37 @@ class RuleFolderCommand(ConfigCommand):
         try:
             self.rule_folder.set_read_only(is_read_only=True)
         except Exception as ex:
-            message = "set attribute [post command]"
-            log.exception(error_message(self.rule_folder, message), ex)
+            self.log_error(self.rule_folder, "set attribute [post command]", ex)
 
 
 class IconFolderCommand(ConfigCommand):
+    __slots__ = ("icon_folder",)
+
     def __init__(self, order: int, copy_icon: bool, icon_folder: MatchedIconFolder) -> None:
         super().__init__(order, copy_icon)
         self.icon_folder = icon_folder
 
     def pre_command(self):
-        if not self.copy_icon or self.icon_folder.exists():
+        if not self.copy_icon or self.target_exists(self.icon_folder):
             return
         try:
             self.icon_folder.create()
+            self._exists = True
         except Exception as ex:
-            message = "create folder [pre command]"
-            log.exception(error_message(self.icon_folder, message), ex)
+            self.log_error(self.icon_folder, "create folder [pre command]", ex)
 
     def post_command(self):
-        if not self.icon_folder.exists():
+        if not self.target_exists(self.icon_folder):
             return
         try:
             self.icon_folder.set_hidden(is_hidden=True)
         except Exception as ex:
-            message = "set attribute [post command]"
-            log.exception(error_message(self.icon_folder, message), ex)
+            self.log_error(self.icon_folder, "set attribute [post command]", ex)
 
 
 class IconFileCommand(ConfigCommand):
+    __slots__ = ("icon", "library")
+
     def __init__(
         self,
         order: int,
@@ -192,45 +239,46 @@ class IconFileCommand(ConfigCommand):
         self.library = library
 
     def pre_command(self):
-        if not self.copy_icon or self.icon.exists():
+        if not self.copy_icon or self.target_exists(self.icon):
             return
         try:
-            with lock:
-                self.library.copy_to(self.icon)
+            self.library.copy_to(self.icon)
+            self._exists = True
         except Exception as ex:
-            log.exception(error_message(self.icon, "copy library icon"), ex)
+            self.log_error(self.icon, "copy library icon", ex)
 
     def post_command(self):
-        if not self.icon.exists():
+        if not self.target_exists(self.icon):
             return
         try:
             self.icon.set_hidden(is_hidden=True)
         except Exception as ex:
-            log.exception(error_message(self.icon, "icon file attribute"), ex)
+            self.log_error(self.icon, "icon file attribute", ex)
 
 
 class DesktopIniCommand(ConfigCommand):
+    __slots__ = ("desktop",)
+
     def __init__(self, order: int, copy_icon: bool, desktop: DesktopIniFile) -> None:
         super().__init__(order, copy_icon)
         self.desktop = desktop
 
     def pre_command(self):
-        if not self.desktop.exists():
+        if not self.target_exists(self.desktop):
             return
         try:
             self.desktop.set_writeable_and_visible()
         except Exception as ex:
-            message = "set attribute [pre command]"
-            log.exception(error_message(self.desktop, message), ex)
+            self.log_error(self.desktop, "set attribute [pre command]", ex)
 
     def post_command(self):
+        # desktop.ini is written between pre and post command, check it again
         if not self.desktop.exists():
             return
         try:
             self.desktop.set_protected_and_hidden()
         except Exception as ex:
-            message = "set attribute [post command]"
-            log.exception(error_message(self.desktop, message), ex)
+            self.log_error(self.desktop, "set attribute [post command]", ex)
 
 
 # endregion
@@ -239,59 +287,75 @@ class DesktopIniCommand(ConfigCommand):
 # region DESKTOP INI CONTROLLER
 
 
-def get_commands(rule_folder: MatchedRuleFolder, copy_icon: bool) -> list[ConfigCommand]:
+def get_commands(rule_folder: MatchedRuleFolder, copy_icon: bool) -> tuple[ConfigCommand, ...]:
+    # Ordered by construction, the post commands run in reversed order
     icon_folder = rule_folder.icon_folder
     local_icon = rule_folder.local_icon
     library_icon = rule_folder.library_icon
-    return [
+    return (
         RuleFolderCommand(1, copy_icon, rule_folder),
         IconFolderCommand(2, copy_icon, icon_folder),
         IconFileCommand(3, copy_icon, local_icon, library_icon),
         DesktopIniCommand(4, copy_icon, rule_folder.desktop_ini),
-    ]
+    )
+
+
+# Lines are separated by CRLF, the shell reads desktop.ini like an INI file on Windows
+_INI_TEMPLATE = "\r\n".join(
+    (
+        "[.ShellClassInfo]",
+        "IconResource={icon},0",
+        APP_ENTRY,
+        "[ViewState]",
+        "Mode=",
+        "Vid=",
+        "FolderType=Generic",
+    )
+)
 
 
 class DesktopIniCreator:
-    def __init__(self, source: DesktopFileSource = DesktopFileSource()) -> None:
-        self.source = source
-        self.checker = DesktopFileChecker(source)
-        self.commands: list[ConfigCommand] = []
+    def __init__(self, source: DesktopFileSource | None = None) -> None:
+        self.source = source or _DEFAULT_SOURCE
+        self.checker = _checker_for(self.source)
 
     def can_write(self, file: DesktopIniFile) -> bool:
         if not file.exists():
             return True
         return self.checker.is_app_file(file)
 
-    def create_content(self, manager: MatchedRuleFolder) -> Iterable[str]:
-        return [
-            "[.ShellClassInfo]",
-            f"IconResource={manager.icon_path_for_desktop_ini()},0",
-            DesktopIniBuilder.app_entry,
-            "[ViewState]",
-            "Mode=",
-            "Vid=",
-            "FolderType=Generic",
-        ]
-
-    def order_commands(self, commands: List[ConfigCommand], reverse: bool) -> None:
-        commands.sort(key=lambda cmd: cmd.order, reverse=reverse)
-
-    def execute_commands(self, commands: List[ConfigCommand], func_name: str) -> None:
+    def create_content(self, manager: MatchedRuleFolder) -> str:
+        return _INI_TEMPLATE.format(icon=manager.icon_path_for_desktop_ini())
+
+    def execute_pre_commands(self, commands: Iterable[ConfigCommand]) -> None:
         for command in commands:
-            function = getattr(command, func_name)
-            function()
+            command.pre_command()
 
-    def write(self, folder: MatchedRuleFolder, copy_icon: bool) -> None:
-        commands = get_commands(folder, copy_icon)
-        self.order_commands(commands, reverse=False)
-        self.execute_commands(commands, 'pre_command')
+    def execute_post_commands(self, commands: Iterable[ConfigCommand]) -> None:
+        for command in commands:
+            command.post_command()
+
+    def write_desktop_ini(self, folder: MatchedRuleFolder) -> None:
         try:
-            with lock:
-                self.source.write(folder.desktop_ini,
-                                  self.create_content(folder))
+            self.source.write(folder.desktop_ini, self.create_content(folder))
         except Exception as ex:
-            log.exception(error_message(folder, 'Write desktop.ini'), ex)
-        self.order_commands(commands, reverse=True)
-        self.execute_commands(commands, 'post_command')
+            message = error_message(folder, 'Write desktop.ini')
+            log_exception_once(log, type(self).__name__, message, ex)
+
+    def write(self, folder: MatchedRuleFolder, copy_icon: bool) -> None:
+        commands = get_commands(folder, copy_icon)
+        self.execute_pre_commands(commands)
+        self.write_desktop_ini(folder)
+        self.execute_post_commands(reversed(commands))
+
+    def write_many(self, folders: Iterable[tuple[MatchedRuleFolder, bool]]) -> None:
+        """Writes the folders phase by phase, all pre commands, all files, all post commands."""
+        written = [(folder, get_commands(folder, copy_icon)) for folder, copy_icon in folders]
+        for _, commands in written:
+            self.execute_pre_commands(commands)
+        for folder, _ in written:
+            self.write_desktop_ini(folder)
+        for _, commands in written:
+            self.execute_post_commands(reversed(commands))
 
 # endregion
@@ -1,5 +1,6 @@
 import logging
-from collections.abc import Iterable, Sequence
+from collections.abc import Sequence
+from collections.abc import Set as AbstractSet
 
 from icon_manager.config.user import UserConfig
 from icon_manager.content.controller.base import ContentController
@@ -18,12 +19,11 @@ log = logging.getLogger(__name__)
 class IconFileBuilder(FileCrawlerBuilder[MatchedIconFile]):
     def __init__(self) -> None:
         super().__init__()
-        self.icons_names: Iterable[str] = []
+        self.icons_names: AbstractSet[str] = frozenset()
 
     def setup(self, **kwargs) -> None:
         settings = kwargs.get("settings", [])
-        library_icons = [setting.icon for setting in settings]
-        self.icons_names = [icon.name for icon in library_icons]
+        self.icons_names = frozenset(setting.icon.name for setting in settings)
 
     def can_build_file(self, file: File, **kwargs) -> bool:
         return file.name in self.icons_names
@@ -32,22 +32,24 @@ class IconFileBuilder(FileCrawlerBuilder[MatchedIconFile]):
         return MatchedIconFile(file.path)
 
 
+_ICON_EXTENSIONS = (MatchedIconFile.extension(with_point=False),)
+
+
 class IconFileController(ContentController[MatchedIconFile]):
-    def __init__(self, user_config: UserConfig, builder: FileCrawlerBuilder = IconFileBuilder()) -> None:
-        super().__init__(user_config, builder)
+    def __init__(self, user_config: UserConfig, builder: FileCrawlerBuilder | None = None) -> None:
+        super().__init__(user_config, builder or IconFileBuilder())
         self.files: list[MatchedIconFile] = []
 
     @execution(message="Crawle & build icons (__icon__ folder)")
     def crawle_and_build_result(self, folders: list[Folder], settings: Sequence[IconSetting]):
-        extensions = [MatchedIconFile.extension(with_point=False)]
-        files = files_by_extension(folders, extensions)
+        files = files_by_extension(folders, _ICON_EXTENSIONS)
         self.builder.setup(settings=settings)
         self.files = self.builder.build_models(files)
 
     @execution_action(message='Crawle & build icons (__icon__ folder)')
     def delete_content(self) -> Action:
         action = DeleteAction(self. user_config, self.files)
-        action.execute()
+        action.async_execute()
         if not action.any_executed():
             return action
         return action
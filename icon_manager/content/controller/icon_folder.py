@@ -1,5 +1,5 @@
 import logging
-from collections.abc import Iterable, Sequence
+from collections.abc import Sequence
 
 from icon_manager.config.user import UserConfig
 from icon_manager.content.controller.base import ContentController
@@ -27,9 +27,9 @@ class IconFolderController(ContentController[MatchedIconFolder]):
     def __init__(
         self,
         user_config: UserConfig,
-        builder: FolderCrawlerBuilder = IconFolderBuilder(),
+        builder: FolderCrawlerBuilder | None = None,
     ) -> None:
-        super().__init__(user_config, builder)
+        super().__init__(user_config, builder or IconFolderBuilder())
         self.folders: list[MatchedIconFolder] = []
 
     @execution(message="Crawle & build __icon__ folder")
@@ -40,10 +40,7 @@ class IconFolderController(ContentController[MatchedIconFolder]):
     @execution_action(message='Deleted existing __icon__ folder')
     def delete_content(self) -> Action:
         action = DeleteAction(self.user_config, self.folders)
-        action.execute()
+        action.async_execute()
         if not action.any_executed():
             return action
         return action
-
-    def folders_with_icon(self) -> Iterable[MatchedIconFolder]:
-        return [folder for folder in self.folders if len(folder.get_icons()) > 0]
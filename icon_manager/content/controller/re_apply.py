@@ -1,5 +1,6 @@
 import logging
-from typing import Optional, Sequence
+from collections.abc import Iterator
+from typing import Optional
 
 from icon_manager.content.controller.icon_folder import IconFolderController
 from icon_manager.content.models.matched import MatchedIconFolder, MatchedRuleFolder
@@ -24,13 +25,11 @@ class ReApplyController:
             return setting
         return None
 
-    def get_rule_folders(self) -> Sequence[MatchedRuleFolder]:
-        rule_folders = []
-        for folder in self.icon_folders.folders_with_icon():
+    def get_rule_folders(self) -> Iterator[MatchedRuleFolder]:
+        # A folder without icons has no setting, no extra scan to filter them first
+        for folder in self.icon_folders.folders:
             setting = self.get_setting_of(folder)
             if setting is None:
                 continue
             parent = FolderModel(folder.parent_path)
-            rule_folder = MatchedRuleFolder(parent, setting)
-            rule_folders.append(rule_folder)
-        return rule_folders
+            yield MatchedRuleFolder(parent, setting)
@@ -1,4 +1,5 @@
 import logging
+from itertools import takewhile
 from typing import Iterable, List, Optional, Sequence
 
 from icon_manager.config.user import UserConfig
@@ -11,39 +12,94 @@ from icon_manager.helpers.decorator import execution, execution_action
 from icon_manager.helpers.string import ALIGN_LEFT, prefix_value
 from icon_manager.interfaces.actions import Action
 from icon_manager.interfaces.builder import FolderCrawlerBuilder
-from icon_manager.interfaces.path import Folder, FolderModel
+from icon_manager.interfaces.path import Folder, FolderModel, Node
 from icon_manager.library.models import IconSetting
 from icon_manager.rules.manager import ExcludeManager
 
 log = logging.getLogger(__name__)
 
 
+def _first_config_for(settings: Iterable[IconSetting], model: Folder) -> IconSetting | None:
+    for setting in settings:
+        if not setting.is_config_for(model):
+            continue
+        return setting
+    return None
+
+
 class RulesApplyBuilder(FolderCrawlerBuilder[MatchedRuleFolder]):
     def __init__(self) -> None:
         super().__init__()
-        self.settings: Sequence[IconSetting] = []
+        self.settings = []
+
+    @property
+    def settings(self) -> Sequence[IconSetting]:
+        return self._settings
+
+    @settings.setter
+    def settings(self, settings: Iterable[IconSetting]) -> None:
+        self._settings = list(settings)
+        # The leading settings which only check the folder name give the same
+        # result for every folder with this name, the result is kept per name
+        name_settings = list(takewhile(lambda setting: setting.is_name_rule(), self._settings))
+        self._name_settings = name_settings
+        self._other_settings = self._settings[len(name_settings):]
+        self._setting_by_name: dict[str, IconSetting | None] = {}
 
     def setup(self, **kwargs) -> None:
         self.settings = kwargs.get("settings", [])
 
+    def _name_setting_for(self, model: Folder) -> IconSetting | None:
+        try:
+            return self._setting_by_name[model.name]
+        except KeyError:
+            setting = _first_config_for(self._name_settings, model)
+            self._setting_by_name[model.name] = setting
+            return setting
+
     def icon_setting_for(self, model: Folder) -> IconSetting | None:
-        for setting in self.settings:
-            if not setting.is_config_for(model):
-                continue
+        setting = self._name_setting_for(model)
+        if setting is not None:
             return setting
-        return None
+        return _first_config_for(self._other_settings, model)
+
+    def _log_matched(self, model: Folder, config: IconSetting) -> None:
+        action = prefix_value("Icon", width=7, align=ALIGN_LEFT)
+        icon_name = config.icon.name_wo_extension
+        icon_name = prefix_value(f'"{icon_name}"', width=25, align=ALIGN_LEFT)
+        log.debug('%s %s to "%s"', action, icon_name, model.name)
 
     def get_matched_folder(self, model: Folder) -> MatchedRuleFolder | None:
         config = self.icon_setting_for(model)
         if config is None:
             return None
-        action = prefix_value("Icon", width=7, align=ALIGN_LEFT)
-        icon_name = config.icon.name_wo_extension
-        icon_name = prefix_value(f'"{icon_name}"', width=25, align=ALIGN_LEFT)
-        log.debug(f'{action} {icon_name} to "{model.name}"')
+        if log.isEnabledFor(logging.DEBUG):
+            self._log_matched(model, config)
         folder = FolderModel(model.path)
         return MatchedRuleFolder(folder, config)
 
+    def build_models(self, nodes: Iterable[Node], **kwargs) -> list[MatchedRuleFolder]:
+        # Same walk as iter_models, but without the build_model and
+        # get_matched_folder calls per folder, files never give a model
+        matched: list[MatchedRuleFolder] = []
+        append = matched.append
+        setting_for = self.icon_setting_for
+        is_debug = log.isEnabledFor(logging.DEBUG)
+        stack = list(nodes)
+        stack.reverse()
+        while stack:
+            entry = stack.pop()
+            if entry.excluded or not isinstance(entry, Folder):
+                continue
+            config = setting_for(entry)
+            if config is None:
+                continue
+            if is_debug:
+                self._log_matched(entry, config)
+            append(MatchedRuleFolder(FolderModel(entry.path), config))
+            stack.extend(reversed(entry.folders))
+        return matched
+
     def can_build_folder(self, folder: Folder, **kwargs) -> bool:
         return True
 
@@ -65,10 +121,11 @@ class RulesApplyController:
     def __init__(
         self,
         user_config: UserConfig,
-        builder: FolderCrawlerBuilder = RulesApplyBuilder(),
+        builder: FolderCrawlerBuilder | None = None,
     ) -> None:
         self.user_config = user_config
-        self.builder = builder
+        # The builder keeps the settings of its setup, every controller needs its own
+        self.builder = builder or RulesApplyBuilder()
         self.folders: list[MatchedRuleFolder] = []
 
     @execution(message="Crawle and filter result")
@@ -81,6 +138,8 @@ class RulesApplyController:
     def search_and_find_matches(self, folders: list[Folder], settings: Iterable[IconSetting]):
         self.builder.setup(settings=settings)
         self.folders = self.builder.build_models(folders)
+        # One summary instead of a record per matched folder, those are DEBUG only
+        log.info('Matched %s folders', len(self.folders))
 
     @ execution_action(message='Created matched icons', start_message='Creating matched icons')
     def creating_found_matches(self, exclude: ExcludeManager) -> Action:
@@ -92,7 +151,7 @@ class RulesApplyController:
 
     def re_apply_matches(self, controller: ReApplyController):
         action = ReCreateIconAction(controller, self.user_config)
-        action.execute()
+        action.async_execute()
         if not action.any_executed():
             return
         log.info(action.get_log_message(MatchedRuleFolder))
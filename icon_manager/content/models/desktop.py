@@ -1,3 +1,5 @@
+import os
+
 from icon_manager.interfaces.path import FileModel
 
 
@@ -6,7 +8,7 @@ class Git(FileModel):
 
     @classmethod
     def is_model(cls, path: str) -> bool:
-        return path.endswith(cls.file_name)
+        return os.path.basename(path) == cls.file_name
 
 
 class DesktopIniFile(FileModel):
@@ -14,7 +16,7 @@ class DesktopIniFile(FileModel):
 
     @classmethod
     def is_model(cls, path: str) -> bool:
-        return path.endswith(cls.file_name)
+        return os.path.basename(path) == cls.file_name
 
     @classmethod
     def _extension(cls) -> str:
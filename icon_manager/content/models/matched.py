@@ -1,9 +1,10 @@
 import logging
 import os
 from collections.abc import Sequence
+from functools import cached_property
 
 from icon_manager.content.models.desktop import DesktopIniFile
-from icon_manager.helpers.path import get_files
+from icon_manager.helpers.path import get_file_paths
 from icon_manager.interfaces.path import FolderModel
 from icon_manager.library.models import IconFile, IconSetting, LibraryIconFile
 
@@ -19,7 +20,7 @@ class MatchedIconFolder(FolderModel):
 
     @classmethod
     def is_model(cls, path: str) -> bool:
-        return path.endswith(cls.folder_name)
+        return os.path.basename(path) == cls.folder_name
 
     def __init__(self, path: str) -> None:
         super().__init__(path)
@@ -29,7 +30,7 @@ class MatchedIconFolder(FolderModel):
         return MatchedIconFile(icon_path)
 
     def get_icons(self) -> Sequence[IconFile]:
-        icon_paths = get_files(self.path, MatchedIconFile.extension())
+        icon_paths = get_file_paths(self.path, MatchedIconFile.extension())
         return [IconFile(path) for path in icon_paths]
 
 
@@ -42,24 +43,27 @@ class MatchedRuleFolder(FolderModel):
     def library_icon(self) -> LibraryIconFile:
         return self.setting.icon
 
-    @property
+    # The child models are built on first access, the commands of a folder
+    # ask for them several times. Whether the icon exists is checked on
+    # every call, the icon is copied between the commands.
+    @cached_property
     def desktop_ini(self) -> DesktopIniFile:
         file_path = self.child_path(DesktopIniFile.file_name)
         return DesktopIniFile(file_path)
 
-    @property
+    @cached_property
     def icon_folder(self) -> MatchedIconFolder:
         path = self.child_path(MatchedIconFolder.folder_name)
         return MatchedIconFolder(path)
 
-    @property
+    @cached_property
     def local_icon(self) -> MatchedIconFile:
         return self.icon_folder.create_icon(self.library_icon)
 
     def icon_path_for_desktop_ini(self) -> str:
         if self.local_icon.exists():
-            local_path = self.local_icon.path
-            return os.path.relpath(local_path, self.path)
+            # The local icon is always inside the icon folder of this folder
+            return os.path.join(MatchedIconFolder.folder_name, self.local_icon.name)
         return self.library_icon.path
 
     def __str__(self) -> str:
@@ -1,93 +1,97 @@
 import concurrent.futures
+import logging
 import os
+from collections.abc import Set as AbstractSet
 from typing import Dict, Iterable, List, Optional, Sequence
 
 from icon_manager.config.user import UserConfig
 from icon_manager.crawler.filters import (files_by_extension,
                                           is_file_with_extensions)
+from icon_manager.crawler.scanner import scan
+from icon_manager.interfaces import actions
 from icon_manager.interfaces.path import (File, Folder, IconSearchFolder,
                                           SearchFolder,)
 
+log = logging.getLogger(__name__)
 
-def crawle_folder(entry: os.DirEntry, parent: Optional[Folder]) -> Folder:
-    current = Folder.from_path(entry.path, parent)
-    for elem in os.scandir(entry.path):
-        if elem.is_dir():
-            current.folders.append(crawle_folder(elem, current))
-        else:
-            current.files.append(File.from_path(elem.path, current))
-    return current
+NO_STOP_NAMES: AbstractSet[str] = frozenset()
 
 
-def crawling_entry(entry: os.DirEntry, current: Folder) -> Folder:
-    if entry.is_dir():
-        current.folders.append(crawle_folder(entry, current))
-    else:
+def _add_entry(entry: os.DirEntry, current: Folder,
+               stop_names: AbstractSet[str]) -> Folder:
+    if entry.is_dir(follow_symlinks=False):
+        if current.name not in stop_names:
+            current.folders.append(crawle_folder(entry, current, stop_names))
+    elif entry.is_file():
         current.files.append(File.from_path(entry.path, current))
     return current
 
 
-def async_crawle_folder(config: UserConfig, entry: os.DirEntry, parent: Optional[Folder]) -> Folder:
-    current = Folder.from_path(entry.path, parent)
-    prefix = f'{config.name} Crawling {entry.path}'
-    with concurrent.futures.ThreadPoolExecutor(thread_name_prefix=prefix) as executor:
-        task = {executor.submit(crawling_entry, entry, current): entry for entry in os.scandir(entry.path)}
-        for future in concurrent.futures.as_completed(task):
-            root_folder = task[future]
-            try:
-                current = future.result()
-            except Exception as exc:
-                print('%r Exception: %s' % (root_folder.path, exc))
+def _scan_into(current: Folder, stop_names: AbstractSet[str]) -> Folder:
+    for entry in scan(current.path):
+        _add_entry(entry, current, stop_names)
     return current
 
 
-def _crawling_root(config: UserConfig, entry: os.DirEntry, current: Folder) -> Folder:
-    if entry.is_dir():
-        current.folders.append(async_crawle_folder(config, entry, current))
-    else:
-        current.files.append(File.from_path(entry.path, current))
-    return current
-
+def crawle_folder(entry: os.DirEntry, parent: Optional[Folder],
+                  stop_names: AbstractSet[str] = NO_STOP_NAMES) -> Folder:
+    current = Folder.from_path(entry.path, parent)
+    return _scan_into(current, stop_names)
+
+
+def _scan_folder(current: Folder, stop_names: AbstractSet[str]) -> list[Folder]:
+    """Scans a single folder and returns its sub folders, which still have to be scanned."""
+    pending = []
+    enter_folders = current.parent is None or current.name not in stop_names
+    for entry in scan(current.path):
+        if entry.is_dir(follow_symlinks=False):
+            if enter_folders:
+                folder = Folder.from_path(entry.path, current)
+                current.folders.append(folder)
+                pending.append(folder)
+        elif entry.is_file():
+            current.files.append(File.from_path(entry.path, current))
+    return pending
 
-def _async_crawling(config: UserConfig, root: SearchFolder) -> Folder:
-    current = Folder.from_path(root.path, None)
-    prefix = f'{config.name} Crawling {root.path}'
-    with concurrent.futures.ThreadPoolExecutor(thread_name_prefix=prefix) as executor:
-        task = {executor.submit(_crawling_root, config, entry, current)
-                                : entry for entry in os.scandir(root.path)}
-        for future in concurrent.futures.as_completed(task):
-            root_folder = task[future]
-            try:
-                current = future.result()
-            except Exception as exc:
-                print('%r Exception: %s' % (root_folder.path, exc))
-    return current
 
+def async_crawling_folders(config: UserConfig, roots: Sequence[IconSearchFolder],
+                           stop_names: AbstractSet[str] = NO_STOP_NAMES) -> List[Folder]:
+    """Crawl the search folders in parallel.
 
-def async_crawling_folders(config: UserConfig, roots: Sequence[IconSearchFolder]) -> List[Folder]:
-    folders = []
+    Every folder is scanned by its own task of one pool, capped by the --jobs
+    option, so the folders of all levels are read concurrently. Sub-folders of
+    a folder whose name is in ``stop_names`` are not entered, only its files
+    are collected. Folders that can not be read are left out.
+    """
+    folders = [Folder.from_path(root.path, None) for root in roots]
+    failed = []
     prefix = f'Crawler {config.name}'
-    with concurrent.futures.ThreadPoolExecutor(thread_name_prefix=prefix) as executor:
-        task = {executor.submit(_async_crawling, config,
-                                root): root for root in roots}
-        for future in concurrent.futures.as_completed(task):
-            root_folder = task[future]
-            try:
-                folder = future.result()
-                folders.append(folder)
-            except Exception as exc:
-                print('%r Exception: %s' % (root_folder.path, exc))
-    return folders
+    with concurrent.futures.ThreadPoolExecutor(thread_name_prefix=prefix,
+                                               max_workers=actions.MAX_WORKERS) as executor:
+        pending = {executor.submit(_scan_folder, folder, stop_names): folder
+                   for folder in folders}
+        while pending:
+            done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                folder = pending.pop(future)
+                try:
+                    children = future.result()
+                except Exception as exc:
+                    log.error('%r Exception: %s', folder.path, exc)
+                    failed.append(folder)
+                    continue
+                for child in children:
+                    pending[executor.submit(_scan_folder, child, stop_names)] = child
+    # The scan of the parent has finished, no task touches its folders anymore
+    for folder in failed:
+        if folder.parent is not None:
+            folder.parent.folders.remove(folder)
+    return [folder for folder in folders if folder not in failed]
 
 
 def _crawling(root: SearchFolder) -> Folder:
     current = Folder.from_path(root.path, None)
-    for entry in os.scandir(root.path):
-        if entry.is_dir():
-            current.folders.append(crawle_folder(entry, current))
-        else:
-            current.files.append(File.from_path(entry.path, current))
-    return current
+    return _scan_into(current, NO_STOP_NAMES)
 
 
 def crawling_folders(roots: Sequence[IconSearchFolder]) -> List[Folder]:
@@ -110,7 +114,25 @@ def _group_by_extension(files: Iterable[File], extensions: Sequence[str]) -> Dic
     return grouped
 
 
+def _is_wanted_name(name: str, suffixes: tuple[str, ...]) -> bool:
+    # Same result as get_name_and_extension, dot files have no extension
+    return name.endswith(suffixes) and not name.startswith(".")
+
+
+def _scan_files_into(current: Folder, suffixes: tuple[str, ...]) -> Folder:
+    # The extension is checked on the entry name, other files never get a File node
+    for entry in scan(current.path):
+        if entry.is_dir(follow_symlinks=False):
+            folder = Folder.from_path(entry.path, current)
+            current.folders.append(_scan_files_into(folder, suffixes))
+        elif _is_wanted_name(entry.name, suffixes) and entry.is_file():
+            current.files.append(File.from_path(entry.path, current))
+    return current
+
+
 def crawling_icons(root: SearchFolder, extensions: Sequence[str]) -> dict[str, list[File]]:
-    folder = _crawling(root)
-    files = files_by_extension([folder], extensions)
+    current = Folder.from_path(root.path, None)
+    suffixes = tuple(f".{extension}" for extension in extensions)
+    folder = _scan_files_into(current, suffixes)
+    files = files_by_extension([folder])
     return _group_by_extension(files, extensions)
@@ -1,16 +1,17 @@
 from collections.abc import Iterable, Sequence
+from collections.abc import Set as AbstractSet
 
 from icon_manager.crawler.options import FilterOptions
 from icon_manager.interfaces.path import File, Folder
 
-EXCLUDED_FOLDERS: Iterable[str] = []
+EXCLUDED_FOLDERS: AbstractSet[str] = frozenset()
 
 
 def _is_excluded(folder: Folder, options: FilterOptions) -> bool:
     return options.clean_excluded and folder.parent_name in EXCLUDED_FOLDERS
 
 
-PROJECT_FOLDERS: Iterable[str] = []
+PROJECT_FOLDERS: AbstractSet[str] = frozenset()
 
 
 def _is_project(folder: Folder, options: FilterOptions) -> bool:
@@ -64,12 +65,16 @@ def is_folder_with_name(folder: Folder, names: Sequence[str]) -> bool:
     return folder.name in names
 
 
-def folders_by_name(folders: Sequence[Folder], names: Sequence[str]) -> list[Folder]:
-    filtered = []
-    for folder in folders:
-        if is_folder_with_name(folder, names):
+def folders_by_name(folders: Sequence[Folder], names: Iterable[str]) -> list[Folder]:
+    wanted = frozenset(names)
+    filtered: list[Folder] = []
+    # Depth first, a folder comes before its sub folders
+    stack = list(reversed(folders))
+    while stack:
+        folder = stack.pop()
+        if folder.name in wanted:
             filtered.append(folder)
-        filtered.extend(folders_by_name(folder.folders, names))
+        stack.extend(reversed(folder.folders))
     return filtered
 
 
@@ -77,20 +82,16 @@ def is_file_with_extensions(file: File, extensions: Sequence[str]) -> bool:
     return file.ext is not None and file.ext in extensions
 
 
-def _files_by_extension(files: list[File], extensions: Sequence[str] | None = None) -> list[File]:
-    if extensions is None or len(extensions) == 0:
-        return files
-    filtered = []
-    for file in files:
-        if not is_file_with_extensions(file, extensions):
-            continue
-        filtered.append(file)
-    return filtered
-
-
-def files_by_extension(folders: Sequence[Folder], extensions: Sequence[str] | None = None) -> list[File]:
-    files = []
-    for folder in folders:
-        files.extend(_files_by_extension(folder.files, extensions))
-        files.extend(files_by_extension(folder.folders, extensions))
+def files_by_extension(folders: Sequence[Folder], extensions: Iterable[str] | None = None) -> list[File]:
+    wanted = frozenset(extensions) if extensions else None
+    files: list[File] = []
+    # Depth first, the files of a folder come before those of its sub folders
+    stack = list(reversed(folders))
+    while stack:
+        folder = stack.pop()
+        if wanted is None:
+            files.extend(folder.files)
+        else:
+            files.extend(file for file in folder.files if file.ext in wanted)
+        stack.extend(reversed(folder.folders))
     return files
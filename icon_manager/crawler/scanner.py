@@ -0,0 +1,99 @@
+import os
+import sys
+
+FILE_ATTRIBUTE_DIRECTORY = 0x10
+FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+IO_REPARSE_TAG_SYMLINK = 0xA000000C
+
+FIND_EX_INFO_BASIC = 1
+FIND_EX_SEARCH_NAME_MATCH = 0
+FIND_FIRST_EX_LARGE_FETCH = 2
+ERROR_FILE_NOT_FOUND = 2
+ERROR_NO_MORE_FILES = 18
+
+_SKIPPED_NAMES = frozenset((".", ".."))
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _find_first = _kernel32.FindFirstFileExW
+    _find_first.argtypes = (
+        wintypes.LPCWSTR,
+        ctypes.c_int,
+        ctypes.POINTER(wintypes.WIN32_FIND_DATAW),
+        ctypes.c_int,
+        ctypes.c_void_p,
+        wintypes.DWORD,
+    )
+    _find_first.restype = wintypes.HANDLE
+    _find_next = _kernel32.FindNextFileW
+    _find_next.argtypes = (wintypes.HANDLE, ctypes.POINTER(wintypes.WIN32_FIND_DATAW))
+    _find_next.restype = wintypes.BOOL
+    _find_close = _kernel32.FindClose
+    _find_close.argtypes = (wintypes.HANDLE,)
+    _find_close.restype = wintypes.BOOL
+    _INVALID_HANDLE = wintypes.HANDLE(-1).value
+else:
+    _find_first = None
+
+
+class FindEntry:
+    """The part of os.DirEntry the crawler uses, filled from WIN32_FIND_DATAW."""
+
+    __slots__ = ("name", "path", "_attributes", "_reparse_tag")
+
+    def __init__(self, folder: str, name: str, attributes: int, reparse_tag: int) -> None:
+        self.name = name
+        self.path = os.path.join(folder, name)
+        self._attributes = attributes
+        self._reparse_tag = reparse_tag
+
+    def is_symlink(self) -> bool:
+        return bool(self._attributes & FILE_ATTRIBUTE_REPARSE_POINT) and self._reparse_tag == IO_REPARSE_TAG_SYMLINK
+
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        if self.is_symlink():
+            return follow_symlinks and os.path.isdir(self.path)
+        return bool(self._attributes & FILE_ATTRIBUTE_DIRECTORY)
+
+    def is_file(self, follow_symlinks: bool = True) -> bool:
+        if self.is_symlink():
+            return follow_symlinks and os.path.isfile(self.path)
+        return not self._attributes & FILE_ATTRIBUTE_DIRECTORY
+
+    def __repr__(self) -> str:
+        return f"<FindEntry {self.name!r}>"
+
+
+def _find_entries(path: str) -> list[FindEntry]:
+    data = wintypes.WIN32_FIND_DATAW()
+    # Basic info skips the 8.3 name, large fetch reads the folder in bigger chunks
+    handle = _find_first(os.path.join(path, "*"), FIND_EX_INFO_BASIC, ctypes.byref(data),
+                         FIND_EX_SEARCH_NAME_MATCH, None, FIND_FIRST_EX_LARGE_FETCH)
+    if handle == _INVALID_HANDLE:
+        error = ctypes.get_last_error()
+        if error == ERROR_FILE_NOT_FOUND:
+            return []
+        raise ctypes.WinError(error)
+    entries = []
+    try:
+        while True:
+            if data.cFileName not in _SKIPPED_NAMES:
+                entries.append(FindEntry(path, data.cFileName, data.dwFileAttributes, data.dwReserved0))
+            if not _find_next(handle, ctypes.byref(data)):
+                error = ctypes.get_last_error()
+                if error != ERROR_NO_MORE_FILES:
+                    raise ctypes.WinError(error)
+                return entries
+    finally:
+        _find_close(handle)
+
+
+def scan(path: str) -> "list[os.DirEntry] | list[FindEntry]":
+    """Entries of the folder, through FindFirstFileExW on Windows and os.scandir elsewhere."""
+    if _find_first is not None:
+        return _find_entries(path)
+    with os.scandir(path) as entries:
+        return list(entries)
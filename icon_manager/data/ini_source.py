@@ -1,19 +1,50 @@
-from collections.abc import Iterable
+import locale
+import mmap
+from collections.abc import Iterable, Iterator
 
 from icon_manager.content.models.desktop import DesktopIniFile
 from icon_manager.data.base import Source
 
+_LINE_BREAKS = (b"\r", b"\n")
+
+
+def has_line(content: bytes | mmap.mmap, value: bytes) -> bool:
+    """True if a line of content equals value, like line.strip() == value over content.splitlines()."""
+    index = content.find(value)
+    while index != -1:
+        start = max(content.rfind(line_break, 0, index) for line_break in _LINE_BREAKS) + 1
+        ends = [content.find(line_break, index) for line_break in _LINE_BREAKS]
+        end = min((end for end in ends if end != -1), default=len(content))
+        if content[start:end].strip() == value:
+            return True
+        index = content.find(value, index + 1)
+    return False
+
 
 class DesktopFileSource(Source[DesktopIniFile, Iterable[str]]):
-    def read(self, source: DesktopIniFile) -> Iterable[str]:
-        content = []
+    def read(self, source: DesktopIniFile) -> Iterator[str]:
+        """Yields the lines, the file is only read as far as the caller iterates."""
         with open(source.path) as file:
-            content = file.readlines()
-            file.close()
-        return content
+            yield from file
+
+    def read_bytes(self, source: DesktopIniFile) -> bytes:
+        with open(source.path, "rb") as file:
+            return file.read()
+
+    def contains_line(self, source: DesktopIniFile, value: bytes) -> bool:
+        """Searches the memory mapped file for a line which is value, meant for files too large to read at once."""
+        with open(source.path, "rb") as file:
+            try:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return has_line(mapped, value)
+            except ValueError:
+                # An empty file can not be mapped
+                return False
 
-    def write(self, source: DesktopIniFile, content: Iterable[str]) -> None:
-        content_to_write = "\n".join(content)
-        with open(source.path, "w") as file:
+    def write(self, source: DesktopIniFile, content: str | Iterable[str]) -> None:
+        if not isinstance(content, str):
+            content = "\r\n".join(content)
+        # desktop.ini is read by the Windows shell in the ANSI code page
+        content_to_write = content.encode(locale.getpreferredencoding(False))
+        with open(source.path, "wb", buffering=0) as file:
             file.write(content_to_write)
-            file.close()
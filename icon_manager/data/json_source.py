@@ -1,18 +1,53 @@
 import json
+import os
 from typing import Any
 
 from icon_manager.data.base import Source
 from icon_manager.interfaces.path import JsonFile
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - optional speedup
+    simdjson = None
+
+
+def _loads(content: bytes) -> dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(content)
+    if simdjson is not None:
+        return simdjson.loads(content)
+    return json.loads(content)
+
+
+def _clone(content: Any) -> Any:
+    if isinstance(content, dict):
+        return {key: _clone(value) for key, value in content.items()}
+    if isinstance(content, list):
+        return [_clone(value) for value in content]
+    return content
+
+
+# path -> (mtime_ns, size, parsed content)
+_parse_cache: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
 
 class JsonSource(Source[JsonFile, dict[str, Any]]):
     def read(self, source: JsonFile) -> dict[str, Any]:
-        with open(source.path, encoding="utf-8") as config_file:
-            content = json.load(config_file)
-            config_file.close()
-            return content
+        stat = os.stat(source.path)
+        cached = _parse_cache.get(source.path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return _clone(cached[2])
+        with open(source.path, mode="rb") as config_file:
+            content = _loads(config_file.read())
+        _parse_cache[source.path] = (stat.st_mtime_ns, stat.st_size, content)
+        return _clone(content)
 
     def write(self, source: JsonFile, content: dict[str, Any]):
+        _parse_cache.pop(source.path, None)
         with open(source.path, encoding="utf-8", mode="w") as config_file:
             json.dump(fp=config_file, obj=content, indent=4)
-            config_file.close()
@@ -0,0 +1,59 @@
+import logging
+import sys
+from collections.abc import Mapping
+
+log = logging.getLogger(__name__)
+
+# attrib switch -> FILE_ATTRIBUTE_* flag
+FILE_ATTRIBUTES: Mapping[str, int] = {"r": 0x1, "h": 0x2, "s": 0x4}
+# Flags SetFileAttributesW accepts, GetFileAttributesW also returns e.g. DIRECTORY
+SETTABLE_ATTRIBUTES = 0x1 | 0x2 | 0x4 | 0x20 | 0x100 | 0x1000 | 0x2000
+FILE_ATTRIBUTE_NORMAL = 0x80
+INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _get_file_attributes = _kernel32.GetFileAttributesW
+    _get_file_attributes.argtypes = (wintypes.LPCWSTR,)
+    _get_file_attributes.restype = wintypes.DWORD
+    _set_file_attributes = _kernel32.SetFileAttributesW
+    _set_file_attributes.argtypes = (wintypes.LPCWSTR, wintypes.DWORD)
+    _set_file_attributes.restype = wintypes.BOOL
+    _get_last_error = ctypes.get_last_error
+else:
+    _get_file_attributes = None
+    _set_file_attributes = None
+
+    def _get_last_error() -> int:
+        return 0
+
+
+def merge_attributes(current: int, attributes: Mapping[str, str]) -> int:
+    """Applies attrib like switches ({"h": "+", "r": "-"}) to the current flags."""
+    flags = current & SETTABLE_ATTRIBUTES
+    for attribute, value in attributes.items():
+        flag = FILE_ATTRIBUTES[attribute]
+        if value == "+":
+            flags |= flag
+        else:
+            flags &= ~flag
+    return flags or FILE_ATTRIBUTE_NORMAL
+
+
+def set_file_attributes(path: str, attributes: Mapping[str, str]) -> bool:
+    """Sets the attributes in process, returns False if the Windows API is not available or failed."""
+    if _get_file_attributes is None or _set_file_attributes is None:
+        return False
+    current = _get_file_attributes(path)
+    if current == INVALID_FILE_ATTRIBUTES:
+        return False
+    flags = merge_attributes(current, attributes)
+    if flags == current & SETTABLE_ATTRIBUTES:
+        return True
+    if _set_file_attributes(path, flags):
+        return True
+    log.debug("SetFileAttributesW failed for %s [%s]", path, _get_last_error())
+    return False
@@ -2,15 +2,14 @@ import os
 import re
 
 GROUP_NAME = "env"
-ENV_PATTERN = re.compile(r"(?P<env>%[a-zA-Z0-9_-]*%)")
+ENV_PATTERN = re.compile(r"(?P<env>%[a-zA-Z0-9_-]+%)")
 
 
 def get_env_var_value_of(value: str) -> str:
     matches = ENV_PATTERN.match(value)
     if matches is None:
         raise LookupError("No ENVIRONMENT variable found")
-    match_groups = matches.groupdict()
-    variable = match_groups.get(GROUP_NAME, None)
+    variable = matches.group(GROUP_NAME)
     if variable is None:
         raise LookupError("No pattern %%ENVIRONMENT%% found")
     return variable
@@ -26,22 +25,25 @@ def get_env_var_value(value: str) -> str | None:
 
 
 def contains_env_var(value: str) -> bool:
-    try:
-        env_value = get_env_var_value(value)
-        return env_value is not None
-    except LookupError:
+    """Return True if any %VARIABLE% in value is set in the environment."""
+    if "%" not in value:
         return False
+    environ = os.environ
+    return any(match.group(GROUP_NAME)[1:-1] in environ for match in ENV_PATTERN.finditer(value))
 
 
 def get_env_path(value: str) -> str:
-    env_value = get_env_var_value(value)
-    if env_value is None:
-        return value
-    env_var_value = get_env_var_value_of(value)
-    return value.replace(env_var_value, env_value)
+    get_env_var_value_of(value)
+    return get_converted_env_path(value)
+
+
+def _env_value(match: re.Match[str]) -> str:
+    variable = match.group(GROUP_NAME)
+    return os.environ.get(variable[1:-1], variable)
 
 
 def get_converted_env_path(value: str) -> str:
-    if contains_env_var(value):
-        value = get_env_path(value)
-    return value
+    """Replace every %VARIABLE% in value, unknown variables are kept as they are."""
+    if "%" not in value:
+        return value
+    return ENV_PATTERN.sub(_env_value, value)
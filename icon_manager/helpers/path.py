@@ -1,6 +1,6 @@
 import os
 from typing import List, Optional
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Iterator, Sequence
 
 from icon_manager.interfaces.path import File, Folder
 
@@ -29,8 +29,23 @@ def is_file_extensions(file: File, extensions: Sequence[str]) -> bool:
     return file.ext is not None and file.ext in extensions
 
 
+def iter_files(path: str, extension: str | None = None) -> Iterator[os.DirEntry]:
+    if extension is not None and not extension.startswith("."):
+        extension = f".{extension}"
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if extension is not None and not entry.name.endswith(extension):
+                continue
+            if entry.is_file():
+                yield entry
+
+
 def get_files(path: str, extension: str | None = None) -> list[str]:
-    return [name for name in os.listdir(path) if is_file(path, name, extension)]
+    return [entry.name for entry in iter_files(path, extension)]
+
+
+def get_file_paths(path: str, extension: str | None = None) -> list[str]:
+    return [entry.path for entry in iter_files(path, extension)]
 
 
 def get_path(path: str, name: str) -> str:
@@ -38,22 +53,26 @@ def get_path(path: str, name: str) -> str:
 
 
 def get_paths(path: str, names: Iterable[str]) -> list[str]:
-    return [get_path(path, name) for name in names]
+    join = os.path.join
+    return [join(path, name) for name in names]
 
 
 def count_of(folder: Folder) -> tuple[int, int]:
     return len(folder.folders), len(folder.files)
 
 
-def count_of_recursive(entry: Folder) -> Iterable[tuple[int, int]]:
-    counts = [count_of(entry)]
-    for folder in entry.folders:
-        counts.extend(count_of_recursive(folder))
-    return counts
+def count_of_recursive(entry: Folder) -> Iterator[tuple[int, int]]:
+    stack = [entry]
+    while stack:
+        folder = stack.pop()
+        yield count_of(folder)
+        stack.extend(reversed(folder.folders))
 
 
 def total_count(entries: Iterable[Folder]) -> tuple[int, int]:
-    counts: list[tuple[int, int]] = []
+    folders = files = 0
     for entry in entries:
-        counts.extend(count_of_recursive(entry))
-    return (sum([count[0] for count in counts]), sum([count[1] for count in counts]))
+        for folder_count, file_count in count_of_recursive(entry):
+            folders += folder_count
+            files += file_count
+    return folders, files
@@ -2,11 +2,11 @@ import os
 
 from icon_manager.interfaces.path import ConfigFile, JsonFile
 
+RESOURCES_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "resources")
+
 
 def __resources_path(file_name: str) -> str:
-    paths = [os.path.dirname(os.path.abspath(__file__)), "..", "resources"]
-    paths.append(file_name)
-    return os.path.join(*paths)
+    return os.path.join(RESOURCES_PATH, file_name)
 
 
 CONFIG_TEMPLATE_NAME: str = "icon_config_template.json"
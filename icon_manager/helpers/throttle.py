@@ -0,0 +1,21 @@
+import logging
+import threading
+
+# (source, exception type) of the errors already logged with a traceback
+_logged_once: set[tuple[str, str]] = set()
+_lock = threading.Lock()
+
+
+def log_exception_once(logger: logging.Logger, source: str, message: str, ex: BaseException) -> None:
+    """Logs the traceback of the first error per source and type, repeated errors only as warning.
+
+    Must be called inside the except block, like logging.exception.
+    """
+    key = (source, type(ex).__name__)
+    with _lock:
+        first = key not in _logged_once
+        _logged_once.add(key)
+    if first:
+        logger.exception(message)
+    else:
+        logger.warning("%s: %s", message, ex)
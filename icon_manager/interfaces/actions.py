@@ -1,4 +1,5 @@
 import logging
+import os
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from threading import Lock
@@ -8,13 +9,19 @@ from icon_manager.config.user import UserConfig
 from icon_manager.helpers.string import (ALIGN_LEFT, ALIGN_RIGHT, THOUSAND,
                                          fixed_length, list_value,
                                          prefix_value,)
-from icon_manager.interfaces.path import PathModel
+from icon_manager.interfaces.path import FolderModel, PathModel
 
 log = logging.getLogger(__name__)
 
 
 TEntry = TypeVar("TEntry", bound=PathModel)
 
+MAX_WORKERS: int = min(32, (os.cpu_count() or 1) * 4)
+
+
+def max_workers(entry_count: int) -> int:
+    return max(1, min(MAX_WORKERS, entry_count))
+
 
 class Action(ABC, Generic[TEntry]):
     """Abstract base class for path operations.
@@ -46,11 +53,20 @@ class Action(ABC, Generic[TEntry]):
             self.action_execute(entry)
 
     def async_execute(self) -> None:
+        """Execute the action like execute, but spread the entries over threads.
+
+        The actions are I/O-bound, the pool size is capped by MAX_WORKERS.
+        With a single worker or entry the action is executed serially.
+        """
+        workers = max_workers(len(self.entries))
+        if workers == 1:
+            self.execute()
+            return
         prefix = 'execute action'
         if self.config is not None:
             prefix = f'execute action {self.config.name}'
         with ThreadPoolExecutor(thread_name_prefix=prefix,
-                                max_workers=len(self.entries)) as executor:
+                                max_workers=workers) as executor:
             task = {executor.submit(
                 self.action_execute, entry): entry for entry in self.entries}
             for future in as_completed(task):
@@ -58,16 +74,33 @@ class Action(ABC, Generic[TEntry]):
                 try:
                     future.result()
                 except Exception as exc:
-                    log.exception("%r Exception: %s" % (setting, exc))
+                    log.exception("%r Exception: %s", setting, exc)
 
     def action_execute(self, entry: TEntry) -> None:
-        if not self.can_execute(entry):
+        if not self.accept_entry(entry):
             return
+        self.execute_action(entry)
+
+    def accept_entry(self, entry: TEntry) -> bool:
+        """Check the entry and record it as file or folder if it can be executed.
+
+        Parameters
+        ----------
+        entry : TEntry
+            Path entry to check.
+
+        Returns
+        -------
+        bool
+            True if the action has to be executed on this entry, False otherwise.
+        """
+        if not self.can_execute(entry):
+            return False
         if entry.is_file():
             self.files.append(entry)
         if entry.is_dir():
             self.folders.append(entry)
-        self.execute_action(entry)
+        return True
 
     @abstractmethod
     def can_execute(self, entry: TEntry) -> bool:
@@ -108,7 +141,7 @@ class Action(ABC, Generic[TEntry]):
         bool
             True if at least one file or folder was processed, False otherwise.
         """
-        return len(self.files) > 0 or len(self.folders) > 0
+        return bool(self.files) or bool(self.folders)
 
     def _log_prefix(self, model: type, width: int = 10, align: str = ALIGN_LEFT) -> str:
         return prefix_value(model.__name__, width=width, align=align)
@@ -145,13 +178,24 @@ class Action(ABC, Generic[TEntry]):
 class DeleteAction(Action[PathModel]):
     """Concrete action implementation for deleting path entries.
 
-    This action removes files and folders from the filesystem. It only operates
-    on entries that exist on the filesystem.
+    This action removes files and folders from the filesystem. Only entries
+    which existed and were deleted are recorded.
     """
 
     def __init__(self, config: Optional[UserConfig], entries: Sequence[PathModel]) -> None:
         super().__init__(config, entries, 'Deleted')
 
+    def action_execute(self, entry: PathModel) -> None:
+        # The delete tells whether the entry existed, no stat before it
+        if not self.can_execute(entry):
+            return
+        if not entry.remove():
+            return
+        if isinstance(entry, FolderModel):
+            self.folders.append(entry)
+        else:
+            self.files.append(entry)
+
     def can_execute(self, entry: PathModel) -> bool:
         """Check if entry can be deleted.
 
@@ -163,9 +207,9 @@ class DeleteAction(Action[PathModel]):
         Returns
         -------
         bool
-            True if the entry exists on the filesystem, False otherwise.
+            Always True, a missing entry is skipped by the delete itself.
         """
-        return entry.exists()
+        return True
 
     def execute_action(self, entry: PathModel) -> None:
         """Delete the specified entry from the filesystem.
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Generic, Protocol, TypeVar
 
+from icon_manager.interfaces.actions import max_workers
 from icon_manager.interfaces.path import Folder, Node, PathModel
 
 TModel = TypeVar("TModel", bound=object)
@@ -14,6 +16,8 @@ class Builder(Protocol, Generic[TEntry, TModel]):
 
     def build_models(self, nodes: Iterable[TEntry], **kwargs) -> list[TModel]: ...
 
+    def iter_models(self, nodes: Iterable[TEntry], **kwargs) -> Iterator[TModel]: ...
+
     def build_model(self, node: TEntry, **kwargs) -> TModel | None: ...
 
 
@@ -26,36 +30,23 @@ class CrawlerBuilder(ABC, Builder[Node, TModel]):
         pass
 
     def build_models(self, nodes: Iterable[Node], **kwargs) -> list[TModel]:
-        models = []
+        return list(self.iter_models(nodes, **kwargs))
+
+    def iter_models(self, nodes: Iterable[Node], **kwargs) -> Iterator[TModel]:
         for entry in nodes:
             if entry.excluded:
                 continue
             model = self.build_model(entry, **kwargs)
             if model is None:
                 continue
-            models.append(model)
+            yield model
             if isinstance(entry, Folder):
-                models.extend(self.build_models(entry.files))
-                models.extend(self.build_models(entry.folders))
-        return models
-
-    # def build_models_async(self, nodes: Iterable[Node], **kwargs) -> List[TModel]:
-    #     models: List[TModel] = []
-    #     with concurrent.futures.ThreadPoolExecutor() as executor:
-    #         task = {executor.submit(self.build_models, node): node for node in nodes}
-    #         for future in concurrent.futures.as_completed(task):
-    #             entry = task[future]
-    #             try:
-    #                 model = future.result()
-    #                 if model is None:
-    #                     continue
-    #                 models.extend(model)
-    #             except Exception as exc:
-    #                 print('%r Exception: %s' % (entry.path, exc))
-    #     return models
+                yield from self.iter_models(entry.files, **kwargs)
+                yield from self.iter_models(entry.folders, **kwargs)
 
     def build_model(self, node: Node, **kwargs) -> TModel | None:
-        if node.is_dir():
+        # The crawler built the node from the directory entry, no need to stat it again
+        if isinstance(node, Folder):
             if not self.can_build_folder(node, **kwargs):
                 return None
             return self.build_folder_model(node, **kwargs)
@@ -89,6 +80,22 @@ class FolderCrawlerBuilder(CrawlerBuilder[TModel]):
 
 
 class FileCrawlerBuilder(CrawlerBuilder[TModel]):
+    # Builders reading the files set the number of files from which the
+    # files are checked in a thread pool, None builds them serially
+    parallel_threshold: int | None = None
+
+    def build_models(self, nodes: Iterable[Node], **kwargs) -> list[TModel]:
+        nodes = list(nodes)
+        if self.parallel_threshold is None or len(nodes) < self.parallel_threshold:
+            return super().build_models(nodes, **kwargs)
+
+        def build(node: Node) -> list[TModel]:
+            return list(self.iter_models((node,), **kwargs))
+
+        with ThreadPoolExecutor(thread_name_prefix="build models",
+                                max_workers=max_workers(len(nodes))) as executor:
+            return [model for models in executor.map(build, nodes) for model in models]
+
     def can_build_folder(self, folder: Node, **kwargs) -> bool:
         return False
 
@@ -104,15 +111,16 @@ class ModelBuilder(ABC, Builder[PathModel, TModel]):
     def can_build(self, entry: PathModel, **kwargs) -> bool: ...
 
     def build_models(self, nodes: Iterable[PathModel], **kwargs) -> list[TModel]:
-        models: list[TModel] = []
+        return list(self.iter_models(nodes, **kwargs))
+
+    def iter_models(self, nodes: Iterable[PathModel], **kwargs) -> Iterator[TModel]:
         for entry in nodes:
             if not self.can_build(entry):
                 continue
             model = self.build_model(entry, **kwargs)
             if model is None:
                 continue
-            models.append(model, **kwargs)
-        return models
+            yield model
 
     @abstractmethod
     def build_model(self, node: PathModel, **kwargs) -> TModel | None: ...
@@ -25,6 +25,8 @@ class IRuleController(Generic[TModel], RuleProtocol[TModel]):
 
     def is_allowed(self, entry: TModel) -> bool: ...
 
+    def is_name_rule(self) -> bool: ...
+
     def setup_rules(self, values: Iterable[str]) -> None: ...
 
 
@@ -42,6 +44,8 @@ class IAttributeRuleController(IRuleController[TModel]):
 
     def is_allowed(self, entry: TModel) -> bool: ...
 
+    def is_name_rule(self) -> bool: ...
+
     def setup_rules(self, values: Iterable[str]) -> None: ...
 
 
@@ -59,6 +63,8 @@ class IConfigRuleController(IRuleController[TModel]):
 
     def is_allowed(self, entry: TModel) -> bool: ...
 
+    def is_name_rule(self) -> bool: ...
+
     def setup_rules(self, values: Iterable[str]) -> None:
         ...
 
@@ -79,6 +85,9 @@ class IConfigManager(IRuleController[TModel]):
     def is_allowed(self, entry: TModel) -> bool:
         ...
 
+    def is_name_rule(self) -> bool:
+        ...
+
     def setup_rules(self, values: Iterable[str]) -> None:
         ...
 
@@ -4,9 +4,13 @@ import shutil
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Dict, Iterable, List, Optional, Tuple
 from uuid import uuid4
 
+from icon_manager.helpers.attributes import set_file_attributes
+from icon_manager.helpers.throttle import log_exception_once
+
 log = logging.getLogger(__name__)
 
 
@@ -42,7 +46,7 @@ class Node:
         if self.parent is not None:
             return self.parent.path
         parent, name = os.path.split(self.path)
-        if parent is None or len(parent) == 0:
+        if not parent:
             return name
         return parent
 
@@ -77,7 +81,7 @@ class File(Node):
 
     @classmethod
     def from_path(cls, path: str, parent: Optional["Folder"]) -> "File":
-        return File(parent=parent, path=path, excluded=False)
+        return File(parent=parent, path=path)
 
 
 @dataclass()
@@ -90,6 +94,23 @@ class Folder(Node):
     def from_path(cls, path: str, parent: Optional["Folder"]) -> "Folder":
         return Folder(parent=parent, path=path)
 
+    # lower-cased rule attributes, computed on first use by a rule
+    @cached_property
+    def lowered_name(self) -> str:
+        return self.name.lower()
+
+    @cached_property
+    def lowered_path(self) -> str:
+        return self.path.lower()
+
+    @cached_property
+    def lowered_parent_name(self) -> str:
+        return self.parent_name.lower()
+
+    @cached_property
+    def lowered_parent_path(self) -> str:
+        return self.parent_path.lower()
+
     def mark_children(self) -> None:
         for folder in self.folders:
             folder.excluded = True
@@ -136,7 +157,7 @@ class PathModel(ABC):
     @property
     def parent_path(self) -> str:
         head, _ = os.path.split(self.path)
-        if head is None or len(head) == 0:
+        if not head:
             return os.path.dirname(self.path)
         return head
 
@@ -163,6 +184,9 @@ class PathModel(ABC):
         return " ".join(commands)
 
     def set_attrib(self, attributes: dict[str, str]) -> None:
+        # In process on Windows, starting attrib costs a shell per call
+        if set_file_attributes(self.path, attributes):
+            return
         command = self.__command(attributes)
         os.system(command)
 
@@ -174,15 +198,23 @@ class PathModel(ABC):
         attr_dict = get_attr_bit_dict(["s", "h"], is_hidden)
         self.set_attrib(attr_dict)
 
-    def remove(self) -> None:
+    def _remove(self) -> None:
+        if os.path.isfile(self.path):
+            os.remove(self.path)
+        else:
+            shutil.rmtree(self.path, ignore_errors=False)
+
+    def remove(self) -> bool:
+        """Deletes the entry, returns False if it did not exist or could not be deleted."""
         try:
-            if os.path.isfile(self.path):
-                os.remove(self.path)
-            else:
-                shutil.rmtree(self.path, ignore_errors=False)
+            self._remove()
+            return True
+        except FileNotFoundError:
+            return False
         except Exception as ex:
             message = f"Can not delete {self.name} in {self.parent_path}"
-            log.exception(message, ex)
+            log_exception_once(log, type(self).__name__, message, ex)
+            return False
 
     def copy_to(self, destination):
         if not isinstance(destination, PathModel):
@@ -238,6 +270,9 @@ class FileModel(PathModel):
     def is_dir(self) -> bool:
         return False
 
+    def _remove(self) -> None:
+        os.remove(self.path)
+
 
 class JsonFile(FileModel):
     @classmethod
@@ -269,6 +304,9 @@ class FolderModel(PathModel):
     def is_dir(self) -> bool:
         return os.path.exists(self.path)
 
+    def _remove(self) -> None:
+        shutil.rmtree(self.path, ignore_errors=False)
+
     def create(self):
         os.makedirs(self.path, exist_ok=True)
 
@@ -1,5 +1,6 @@
 import logging
 from collections.abc import Iterable, Sequence
+from operator import attrgetter
 
 from icon_manager.config.user import UserConfig
 from icon_manager.content.models.matched import IconSetting
@@ -187,6 +188,8 @@ class IconLibraryController(IConfigHandler, ISettingsHandler):
         self.user_config = user_config
         self.library_icons: Iterable[LibraryIconFile] = []
         self._settings: list[IconSetting] = []
+        self.__icon_index: dict[str, IconSetting] = {}
+        self.__icon_index_of: list[IconSetting] | None = None
 
     def settings(self, clean_empty: bool = True) -> Sequence[IconSetting]:
         """Get icon settings with optional filtering.
@@ -235,7 +238,7 @@ class IconLibraryController(IConfigHandler, ISettingsHandler):
         self.library_icons = self.builder.build_icons(icons)
         self._settings = self.builder.build_models(self.library_icons)
         self.clean_empty_rules()
-        self._settings.sort(key=lambda ele: ele.order_key)
+        self._settings.sort(key=attrgetter('order_key'))
 
     def clean_empty_rules(self):
         """Clean empty rules from all settings."""
@@ -250,7 +253,7 @@ class IconLibraryController(IConfigHandler, ISettingsHandler):
             if icon_config.exists():
                 continue
             template.copy_to(icon_config)
-            log.info(f"Created template for {icon_file.name_wo_extension}")
+            log.info("Created template for %s", icon_file.name_wo_extension)
 
     def update_icon_configs(self):
         """Update all icon configuration files with template data."""
@@ -262,7 +265,7 @@ class IconLibraryController(IConfigHandler, ISettingsHandler):
         """Delete all icon configuration files."""
         configs = [setting.manager.config for setting in self._settings]
         action = DeleteAction(None, configs)
-        action.execute()
+        action.async_execute()
         if not action.any_executed():
             return
         log.info(action.get_log_message(RuleManager))
@@ -275,7 +278,7 @@ class IconLibraryController(IConfigHandler, ISettingsHandler):
             archive_files = setting.archive_files()
             for file in archive_files:
                 self.archive_file(file)
-            log.info(f"Archive {len(archive_files)} of {setting.name}")
+            log.info("Archive %s of %s", len(archive_files), setting.name)
 
     def archive_file(self, file: FileModel):
         """Archive a single file.
@@ -312,8 +315,13 @@ class IconLibraryController(IConfigHandler, ISettingsHandler):
         Returns:
             IconSetting instance or None if not found.
         """
-        for setting in self._settings:
-            if setting.icon.name != icon.name:
-                continue
-            return setting
-        return None
+        return self.__settings_by_icon().get(icon.name)
+
+    def __settings_by_icon(self) -> dict[str, IconSetting]:
+        if self.__icon_index_of is not self._settings:
+            index: dict[str, IconSetting] = {}
+            for setting in self._settings:
+                index.setdefault(setting.icon.name, setting)
+            self.__icon_index = index
+            self.__icon_index_of = self._settings
+        return self.__icon_index
@@ -1,6 +1,7 @@
 import logging
 import os
 from collections.abc import Iterable, Sequence
+from functools import cached_property
 
 from icon_manager.interfaces.path import (FileModel, Folder, FolderModel,
                                           JsonFile, PathModel)
@@ -57,7 +58,7 @@ class IconSetting:
     def name(self) -> str:
         return self.icon.name_wo_extension
 
-    @property
+    @cached_property
     def order_key(self) -> tuple[str, str]:
         weight = f"{self.manager.weight:02d}"
         return (weight, self.manager.name)
@@ -80,6 +81,9 @@ class IconSetting:
     def is_config_for(self, entry: Folder) -> bool:
         return self.manager.is_allowed(entry)
 
+    def is_name_rule(self) -> bool:
+        return self.manager.is_name_rule()
+
     def set_before_or_after(self, before_or_after: Iterable[str]) -> None:
         self.manager.setup_rules(before_or_after)
 
@@ -108,7 +112,7 @@ class ArchiveFolder(FolderModel):
 
     @classmethod
     def is_model(cls, path: str) -> bool:
-        return path.endswith(cls.folder_name)
+        return os.path.basename(path) == cls.folder_name
 
     def get_archive_path(self, model: FileModel) -> str:
         return os.path.join(self.path, model.name)
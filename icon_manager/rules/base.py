@@ -1,19 +1,20 @@
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
 from enum import Enum
+from operator import attrgetter
 from typing import Generic, Protocol, TypeVar
 
 from icon_manager.interfaces.path import Folder
 
 
 class Operator(str, Enum):
-    UNKNOWN = ("unknown",)
-    ANY = ("any",)
+    UNKNOWN = "unknown"
+    ANY = "any"
     ALL = "all"
 
 
 class RuleAttribute(str, Enum):
-    UNKNOWN = ("unknown",)
+    UNKNOWN = "unknown"
     NAME = "name"
     PATH = "path"
     PARENT_NAME = "parent_name"
@@ -45,9 +46,11 @@ class IFilterRule(RuleProtocol[Folder]):
 
     def is_empty(self) -> bool: ...
 
+    def is_name_rule(self) -> bool: ...
+
 
 class Rule(str, Enum):
-    UNKNOWN = ("unknown",)
+    UNKNOWN = "unknown"
     EQUALS = "equals"
     NOT_EQUALS = "not_equals"
     STARTS_WITH = "starts_with"
@@ -81,6 +84,10 @@ class AFilterRule(ABC, IFilterRule):
     def is_allowed(self, entry: Folder) -> bool:
         raise NotImplementedError
 
+    def is_name_rule(self) -> bool:
+        """True if the result only depends on the name of the folder."""
+        return self.attribute == RuleAttribute.NAME
+
     def __str__(self) -> str:
         return self.name
 
@@ -107,17 +114,29 @@ class ISingleRule(IFilterRule):
 
 
 class ASingleRule(AFilterRule, ISingleRule):
+    def __init__(self, attribute: RuleAttribute, operator: Operator) -> None:
+        super().__init__(attribute, operator)
+        self.attribute_value = attrgetter(attribute.value)
+
     @property
     def name(self) -> str:
         return f"Rule {self.attribute.name} [{self.operator.name}] "
 
     def is_allowed(self, entry: Folder) -> bool:
-        value = getattr(entry, self.attribute.value, None)
-        if value is None or self.operator == Operator.UNKNOWN:
+        if self.operator == Operator.UNKNOWN:
             return False
-        value = self.prepare_element_value(value)
+        try:
+            value = self.attribute_value(entry)
+        except AttributeError:
+            return False
+        if value is None:
+            return False
+        value = self.prepare_entry_value(entry, value)
         return self.is_allowed_with_operator(entry, value)
 
+    def prepare_entry_value(self, entry: Folder, value: str) -> str:
+        return self.prepare_element_value(value)
+
     def is_allowed_with_operator(self, entry: Folder, value: str) -> bool:
         if self.operator == Operator.ALL:
             return self.are_all_allowed(entry, value)
@@ -11,7 +11,7 @@ from icon_manager.interfaces.path import ConfigFile, JsonFile
 from icon_manager.rules.base import (IFilterRule, ISingleRule, Operator,
                                      RuleAttribute)
 from icon_manager.rules.factory.rules import (ConfigKeys, get_builders,
-                                              pop_operator,)
+                                              get_operator,)
 from icon_manager.rules.manager import (AttributeRuleHandler,
                                         ConfigRuleController, ExcludeManager,
                                         RuleManager,)
@@ -40,7 +40,7 @@ class AttributeCheckerFactory(ContentFactory[Dict[str, Any], AttributeRuleHandle
 
     def create(self, config: Dict[str, Any], **kwargs) -> AttributeRuleHandler:
         attribute = kwargs.get(ConfigKeys.ATTRIBUTE, RuleAttribute.UNKNOWN)
-        operator = pop_operator(config, Operator.ANY)
+        operator = get_operator(config, Operator.ANY)
         rules = self.create_rules(config, **kwargs)
         return AttributeRuleHandler(attribute, operator, rules)
 
@@ -55,6 +55,10 @@ def get_rule_attribute(value) -> RuleAttribute:
     return RuleAttribute.UNKNOWN
 
 
+# Keys of a rule config section that are settings and not rule attributes
+SETTING_KEYS = frozenset({ConfigKeys.OPERATOR, ConfigKeys.COPY_ICON, ConfigKeys.ORDER})
+
+
 class SourceCheckerBuilder(ContentFactory[Dict[str, Any], ConfigRuleController]):
 
     def __init__(self, source: Source = JsonSource()) -> None:
@@ -64,13 +68,15 @@ class SourceCheckerBuilder(ContentFactory[Dict[str, Any], ConfigRuleController])
     def get_attribute_checkers(self, config: Dict[str, Any]) -> Sequence[AttributeRuleHandler]:
         managers = []
         for attribute, rules_configs in config.items():
+            if attribute in SETTING_KEYS:
+                continue
             rule_attr = get_rule_attribute(attribute)
             manager = self.factory.create(rules_configs, attribute=rule_attr)
             managers.append(manager)
         return managers
 
     def create(self, config: Dict[str, Any], **kwargs) -> ConfigRuleController:
-        operator = pop_operator(config, Operator.ALL)
+        operator = get_operator(config, Operator.ALL)
         managers = self.get_attribute_checkers(config)
         return ConfigRuleController(managers, operator)
 
@@ -107,8 +113,8 @@ class RuleManagerFactory(AManagerFactory[RuleManager, dict[str, Any]]):
         file: JsonFile | None = kwargs.get("file", None)
         if file is None:
             raise ValueError('"file" is not in kwargs or None')
-        copy_icon = config.pop(ConfigKeys.COPY_ICON, None)
-        order = config.pop(ConfigKeys.ORDER, 5)
+        copy_icon = config.get(ConfigKeys.COPY_ICON, None)
+        order = config.get(ConfigKeys.ORDER, 5)
         manager = self.builder.create(config, **kwargs)
         return RuleManager(file, manager, order, copy_icon)
 
@@ -122,7 +128,7 @@ class RuleManagerFactory(AManagerFactory[RuleManager, dict[str, Any]]):
             if section == ConfigKeys.CONFIG:
                 updated[section] = content[section]
         self.source.write(config, updated)
-        log.info(f"Updated config {config.name_wo_extension}")
+        log.info("Updated config %s", config.name_wo_extension)
 
 
 class ExcludeManagerFactory(AManagerFactory[ExcludeManager, Iterable[dict[str, Any]]]):
@@ -1,7 +1,9 @@
 import logging
+import sys
 from abc import ABC, abstractmethod
-from collections.abc import Collection, Iterable, Sequence
+from collections.abc import Collection, Iterable, Mapping, Sequence
 from enum import Enum
+from types import MappingProxyType
 from typing import (
     Any,
     TypeVar,
@@ -42,13 +44,11 @@ class ConfigValues(str, Enum):
     BEFORE_OR_AFTER = "before_or_after_values"
 
 
+_OPERATOR_BY_VALUE: dict[str, Operator] = {operator.value: operator for operator in Operator}
+
+
 def get_operator_enum(value: str) -> Operator:
-    value = value.lower()
-    for operator in Operator:
-        if operator.value != value:
-            continue
-        return operator
-    return Operator.UNKNOWN
+    return _OPERATOR_BY_VALUE.get(value.lower(), Operator.UNKNOWN)
 
 
 def get_operator(rule_config: dict[str, Any], default: Operator = Operator.ANY) -> Operator:
@@ -56,20 +56,16 @@ def get_operator(rule_config: dict[str, Any], default: Operator = Operator.ANY)
     return get_operator_enum(value)
 
 
-def pop_operator(rule_config: dict[str, Any], default: Operator = Operator.ANY) -> Operator:
-    value = rule_config.pop(ConfigKeys.OPERATOR, default)
-    return get_operator_enum(value)
-
-
-RULE_MAPPING = rule_mapping()
+RULE_MAPPING: Mapping[Rule, type[ISingleRule]] = MappingProxyType(rule_mapping())
+# Rule names in lookup order, keyed by the plain string used in the JSON configs
+_RULE_NAMES: tuple[tuple[str, Rule], ...] = tuple((sys.intern(rule.value), rule) for rule in RULE_MAPPING)
 
 
 def get_rule_name(rule_config: dict[str, Any]) -> Rule:
-    for rule in RULE_MAPPING.keys():
-        name_value = rule_config.get(rule, None)
-        if name_value is None:
-            continue
-        return rule
+    config_value = rule_config.get
+    for name, rule in _RULE_NAMES:
+        if config_value(name) is not None:
+            return rule
     return Rule.UNKNOWN
 
 
@@ -120,7 +116,7 @@ class ARuleBuilder(ABC, ContentFactory[dict[str, Any], TRule]):
         return attribute
 
     def get_case_sensitive(self, rule_config: dict[str, Any]) -> bool:
-        return rule_config.pop(ConfigKeys.CASE_SENSITIVE, False)
+        return rule_config.get(ConfigKeys.CASE_SENSITIVE, False)
 
     def can_build(self, rule_config: dict[str, Any]) -> bool:
         can_build = self.is_builder(rule_config)
@@ -165,7 +161,7 @@ class FolderRuleBuilder(ASingleRuleBuilder[FolderRule]):
         super().__init__(rule_type=FolderRule, **kwargs)
 
     def create_rule(self, attribute: RuleAttribute, config: dict[str, Any]) -> FolderRule:
-        operator = pop_operator(config)
+        operator = get_operator(config)
         case_sensitive = self.get_case_sensitive(config)
         rule = self.get_rule(config)
         values = config.get(rule, [])
@@ -202,7 +198,7 @@ class ContainsFileRuleBuilder(ASingleRuleBuilder[ContainsFileRule]):
         case_sensitive = self.get_case_sensitive(rule_config)
         before_or_after = self.add_before_or_after(rule_config)
         before_or_after_values = self.get_before_or_after_values(rule_config)
-        level = rule_config.pop(ConfigKeys.SEARCH_LEVEL, 1)
+        level = rule_config.get(ConfigKeys.SEARCH_LEVEL, 1)
         rule_type = self.get_rule_type(rule_config)
         return rule_type(
             attribute,
@@ -260,7 +256,7 @@ class ChainedRuleBuilder(ARuleBuilder[ChainedRule]):
         return rules
 
     def create(self, config: dict[str, Any], **kwargs) -> ChainedRule:
-        operator = pop_operator(config)
+        operator = get_operator(config)
         rule_type = self.get_rule_type(config)
         rules = self.get_single_rules(config, **kwargs)
         attribute: str = self.get_attribute(**kwargs)
@@ -38,6 +38,9 @@ class AttributeRuleHandler(IAttributeRuleController[Folder]):
             return all(rule.is_allowed(entry) for rule in self.rules)
         return any(rule.is_allowed(entry) for rule in self.rules)
 
+    def is_name_rule(self) -> bool:
+        return all(rule.is_name_rule() for rule in self.rules)
+
     def setup_rules(self, before_or_after: Iterable[str]) -> None:
         for rule in self.rules:
             rule.set_before_or_after(before_or_after)
@@ -80,6 +83,9 @@ class ConfigRuleController(IConfigRuleController[Folder]):
             return all(checker.is_allowed(entry) for checker in self.controllers)
         return any(rule.is_allowed(entry) for rule in self.controllers)
 
+    def is_name_rule(self) -> bool:
+        return all(checker.is_name_rule() for checker in self.controllers)
+
     def setup_rules(self, before_or_after: Iterable[str]) -> None:
         for checker in self.controllers:
             checker.setup_rules(before_or_after)
@@ -113,6 +119,9 @@ class RuleManager(IConfigManager[Folder]):
     def is_allowed(self, entry: Folder) -> bool:
         return self.checker.is_allowed(entry)
 
+    def is_name_rule(self) -> bool:
+        return self.checker.is_name_rule()
+
     def setup_rules(self, before_or_after: Iterable[str]) -> None:
         self.checker.setup_rules(before_or_after)
 
@@ -151,6 +160,9 @@ class ExcludeManager(IConfigManager[Folder]):
             return False
         return self.is_allowed(entry)
 
+    def is_name_rule(self) -> bool:
+        return all(checker.is_name_rule() for checker in self.checkers)
+
     def setup_rules(self, before_or_after: Iterable[str]) -> None:
         for checker in self.checkers:
             checker.setup_rules(before_or_after)
@@ -23,7 +23,7 @@ def rule_mapping() -> dict[Rule, type[ISingleRule]]:
             continue
         rule_class = globals().get(_rule_class_name(rule))
         if rule_class is None or not is_rule(rule_class):
-            log.warning("No rule for >> %s <<" % rule)
+            log.warning("No rule for >> %s <<", rule)
             continue
         rules[rule] = rule_class
     return rules
@@ -0,0 +1,66 @@
+import re
+from collections.abc import Collection
+from typing import Protocol
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional speedup
+    ahocorasick = None
+
+
+class Matcher(Protocol):
+    def contains_any(self, value: str) -> bool: ...
+
+    def contains_all(self, value: str) -> bool: ...
+
+
+class SubstringMatcher(Matcher):
+    def __init__(self, rule_values: Collection[str]) -> None:
+        super().__init__()
+        self.rule_values = tuple(rule_values)
+
+    def contains_any(self, value: str) -> bool:
+        return any(rule_value in value for rule_value in self.rule_values)
+
+    def contains_all(self, value: str) -> bool:
+        return all(rule_value in value for rule_value in self.rule_values)
+
+
+class PatternMatcher(SubstringMatcher):
+    def __init__(self, rule_values: Collection[str]) -> None:
+        super().__init__(rule_values)
+        self.pattern = re.compile("|".join(map(re.escape, self.rule_values)))
+
+    def contains_any(self, value: str) -> bool:
+        return self.pattern.search(value) is not None
+
+
+class AutomatonMatcher(Matcher):
+    def __init__(self, rule_values: Collection[str]) -> None:
+        super().__init__()
+        self.rule_values = frozenset(rule_values)
+        self.automaton = ahocorasick.Automaton()
+        for rule_value in self.rule_values:
+            self.automaton.add_word(rule_value, rule_value)
+        self.automaton.make_automaton()
+
+    def contains_any(self, value: str) -> bool:
+        for _ in self.automaton.iter(value):
+            return True
+        return False
+
+    def contains_all(self, value: str) -> bool:
+        found: set[str] = set()
+        for _, rule_value in self.automaton.iter(value):
+            found.add(rule_value)
+            if len(found) == len(self.rule_values):
+                return True
+        return False
+
+
+def create_matcher(rule_values: Collection[str]) -> Matcher:
+    if len(rule_values) < 2 or "" in rule_values:
+        return SubstringMatcher(rule_values)
+    if ahocorasick is None:
+        return PatternMatcher(rule_values)
+    return AutomatonMatcher(rule_values)
@@ -1,7 +1,7 @@
 import logging
 from abc import abstractmethod
 from collections.abc import Collection, Iterable, Sequence
-from typing import Any
+from operator import attrgetter
 
 from icon_manager.interfaces.path import Folder
 from icon_manager.rules.base import (AFilterRule, ASingleRule, ISingleRule,
@@ -9,6 +9,7 @@ from icon_manager.rules.base import (AFilterRule, ASingleRule, ISingleRule,
 from icon_manager.rules.generate import (AfterGenerator, BeforeGenerator,
                                          BeforeOrAfterGenerator, CaseConverter,
                                          Generator, GeneratorManager,)
+from icon_manager.rules.matcher import create_matcher
 
 log = logging.getLogger(__name__)
 
@@ -56,9 +57,10 @@ class FolderRule(ASingleRule):
         before_or_after_values: Collection[str],
     ) -> None:
         super().__init__(attribute, operator)
-        self.original_values = list(rule_values)
-        self.generated: Collection[str] = []
-        self.rule_values = rule_values
+        self.lowered_value = attrgetter(f"lowered_{attribute.value}")
+        self.original_values: tuple[str, ...] = tuple(rule_values)
+        self.generated: tuple[str, ...] = ()
+        self.rule_values: tuple[str, ...] = self.original_values
         self.generator = GeneratorManager()
         self.is_case_sensitive = case_sensitive
         self.add_before_or_after_values = before_or_after
@@ -66,7 +68,7 @@ class FolderRule(ASingleRule):
         self.generator.converters = [CaseConverter(case_sensitive)]
 
     def is_empty(self) -> bool:
-        return len(self.rule_values) == 0
+        return not self.rule_values
 
     def get_generators(self) -> Sequence[Generator]:
         return [BeforeGenerator(), AfterGenerator(), BeforeOrAfterGenerator()]
@@ -87,8 +89,8 @@ class FolderRule(ASingleRule):
         return self.generator.generates_unique(values, include_value)
 
     def setup_filter_rule(self) -> None:
-        self.rule_values = self.prepare_rule_values(self.original_values)
-        self.generated = self._before_or_after(self.rule_values)
+        self.rule_values = tuple(self.prepare_rule_values(self.original_values))
+        self.generated = tuple(self._before_or_after(self.rule_values))
 
     def prepare_rule_values(self, values: Collection[str]) -> Collection[str]:
         return self.generator.converts(values)
@@ -96,24 +98,29 @@ class FolderRule(ASingleRule):
     def prepare_element_value(self, value: str) -> str:
         return self.generator.convert(value)
 
-    def are_any_allowed(self, entry: Folder, value: Any) -> bool:
+    def prepare_entry_value(self, entry: Folder, value: str) -> str:
+        if self.is_case_sensitive:
+            return value
+        return self.lowered_value(entry)
+
+    def are_any_allowed(self, entry: Folder, value: str) -> bool:
         if self._are_any_allowed(entry, value, self.rule_values):
             return True
-        if len(self.generated) == 0:
+        if not self.generated:
             return False
         return self._are_any_allowed(entry, value, self.generated)
 
-    def _are_any_allowed(self, entry: Folder, value: Any, rule_values: Iterable[str]) -> bool:
+    def _are_any_allowed(self, entry: Folder, value: str, rule_values: Iterable[str]) -> bool:
         return any(self.is_value_allowed(entry, value, rule_value) for rule_value in rule_values)
 
-    def are_all_allowed(self, entry: Folder, value: Any) -> bool:
+    def are_all_allowed(self, entry: Folder, value: str) -> bool:
         if self._are_all_allowed(entry, value, self.rule_values):
             return True
-        if len(self.generated) == 0:
+        if not self.generated:
             return False
         return self._are_all_allowed(entry, value, self.generated)
 
-    def _are_all_allowed(self, entry: Folder, value: Any, rule_values: Iterable[str]) -> bool:
+    def _are_all_allowed(self, entry: Folder, value: str, rule_values: Iterable[str]) -> bool:
         return all(self.is_value_allowed(entry, value, rule_value) for rule_value in rule_values)
 
     @abstractmethod
@@ -128,25 +135,109 @@ class FolderRule(ASingleRule):
 
 
 class EqualsRule(FolderRule):
+    def __init__(
+        self,
+        attribute: RuleAttribute,
+        operator: Operator,
+        rule_values: Collection[str],
+        case_sensitive: bool,
+        before_or_after: bool,
+        before_or_after_values: Collection[str],
+    ) -> None:
+        super().__init__(
+            attribute,
+            operator,
+            rule_values,
+            case_sensitive,
+            before_or_after,
+            before_or_after_values,
+        )
+        self.value_set = frozenset(self.rule_values)
+        self.generated_set: frozenset[str] = frozenset()
+
+    def setup_filter_rule(self) -> None:
+        super().setup_filter_rule()
+        self.value_set = frozenset(self.rule_values)
+        self.generated_set = frozenset(self.generated)
+
+    def are_any_allowed(self, entry: Folder, value: str) -> bool:
+        return value in self.value_set or value in self.generated_set
+
+    def _are_all_allowed(self, _: Folder, value: str, rule_values: Iterable[str]) -> bool:
+        return all(rule_value == value for rule_value in rule_values)
 
     def is_value_allowed(self, _: Folder, value: str, rule_value: str) -> bool:
         return rule_value == value
 
 
 class NotEqualsRule(EqualsRule):
+    def are_any_allowed(self, entry: Folder, value: str) -> bool:
+        return FolderRule.are_any_allowed(self, entry, value)
+
+    def _are_any_allowed(self, _: Folder, value: str, rule_values: Iterable[str]) -> bool:
+        return any(rule_value != value for rule_value in rule_values)
+
+    def _are_all_allowed(self, _: Folder, value: str, rule_values: Iterable[str]) -> bool:
+        return all(rule_value != value for rule_value in rule_values)
+
     def is_value_allowed(self, entry: Folder, value: str, rule_value: str) -> bool:
         return not super().is_value_allowed(entry, value, rule_value)
 
 
 class ContainsRule(FolderRule):
+    def __init__(
+        self,
+        attribute: RuleAttribute,
+        operator: Operator,
+        rule_values: Collection[str],
+        case_sensitive: bool,
+        before_or_after: bool,
+        before_or_after_values: Collection[str],
+    ) -> None:
+        super().__init__(
+            attribute,
+            operator,
+            rule_values,
+            case_sensitive,
+            before_or_after,
+            before_or_after_values,
+        )
+        self.value_matcher = create_matcher(self.rule_values)
+        self.generated_matcher = create_matcher(self.generated)
+
     def get_generators(self) -> Sequence[Generator]:
         return self.before_and_after_generators()
 
+    def setup_filter_rule(self) -> None:
+        super().setup_filter_rule()
+        self.value_matcher = create_matcher(self.rule_values)
+        self.generated_matcher = create_matcher(self.generated)
+
+    def are_any_allowed(self, entry: Folder, value: str) -> bool:
+        if self.value_matcher.contains_any(value):
+            return True
+        return bool(self.generated) and self.generated_matcher.contains_any(value)
+
+    def are_all_allowed(self, entry: Folder, value: str) -> bool:
+        if self.value_matcher.contains_all(value):
+            return True
+        return bool(self.generated) and self.generated_matcher.contains_all(value)
+
     def is_value_allowed(self, _: Folder, value: str, rule_value: str) -> bool:
         return rule_value in value
 
 
 class NotContainsRule(ContainsRule):
+    def are_any_allowed(self, entry: Folder, value: str) -> bool:
+        if not self.value_matcher.contains_all(value):
+            return True
+        return bool(self.generated) and not self.generated_matcher.contains_all(value)
+
+    def are_all_allowed(self, entry: Folder, value: str) -> bool:
+        if not self.value_matcher.contains_any(value):
+            return True
+        return bool(self.generated) and not self.generated_matcher.contains_any(value)
+
     def is_value_allowed(self, entry: Folder, value: str, rule_value: str) -> bool:
         return not super().is_value_allowed(entry, value, rule_value)
 
@@ -158,6 +249,11 @@ class StartsWithRule(FolderRule):
     def is_value_allowed(self, _: Folder, value: str, rule_value: str) -> bool:
         return value.startswith(rule_value)
 
+    def _are_any_allowed(self, _: Folder, value: str, rule_values: Iterable[str]) -> bool:
+        # startswith and endswith take the values as tuple, one call checks all
+        rule_values = tuple(rule_values)
+        return value.startswith(rule_values)
+
 
 class EndsWithRule(FolderRule):
     def get_generators(self) -> Sequence[Generator]:
@@ -166,6 +262,10 @@ class EndsWithRule(FolderRule):
     def is_value_allowed(self, _: Folder, value: str, rule_value: str) -> bool:
         return value.endswith(rule_value)
 
+    def _are_any_allowed(self, _: Folder, value: str, rule_values: Iterable[str]) -> bool:
+        rule_values = tuple(rule_values)
+        return value.endswith(rule_values)
+
 
 class StartsOrEndsWithRule(FolderRule):
     def get_generators(self) -> Sequence[Generator]:
@@ -174,6 +274,10 @@ class StartsOrEndsWithRule(FolderRule):
     def is_value_allowed(self, entry: Folder, value: str, rule_value: str) -> bool:
         return value.startswith(rule_value) or value.endswith(rule_value)
 
+    def _are_any_allowed(self, _: Folder, value: str, rule_values: Iterable[str]) -> bool:
+        rule_values = tuple(rule_values)
+        return value.startswith(rule_values) or value.endswith(rule_values)
+
 
 class IPathOperationRule(IRuleValuesFilter):
     operator: Operator
@@ -212,8 +316,8 @@ class ContainsFileRule(FolderRule, IPathOperationRule):
                  before_or_after_values: Collection[str], level: int) -> None:
         super().__init__(attribute, operator, values, case_sensitive,
                          before_or_after, before_or_after_values)
-        self.max_level = level
-        self.replace_values = ["*", "."]
+        self.max_level: int = level
+        self.replace_values: tuple[str, ...] = ("*", ".")
 
     def get_generators(self) -> Sequence[Generator]:
         return []
@@ -229,11 +333,15 @@ class ContainsFileRule(FolderRule, IPathOperationRule):
         values = [self.get_rule_value(value) for value in values]
         return super().prepare_rule_values(values)
 
+    def is_name_rule(self) -> bool:
+        # The content of the folder is checked, not only the attribute
+        return False
+
     def get_extensions_of(self, folder: Folder) -> set[str]:
         extensions = [file.ext for file in folder.files]
         return set([ext for ext in extensions if ext is not None])
 
-    def get_extensions(self, entry: Folder, level: int) -> Iterable[str]:
+    def get_extensions(self, entry: Folder, level: int) -> set[str]:
         extensions = self.get_extensions_of(entry)
         level += 1
         if level >= self.max_level:
@@ -251,7 +359,6 @@ class ContainsFileRule(FolderRule, IPathOperationRule):
 
 
 class NotContainsFileRule(ContainsFileRule):
-    @matched_value()
     def is_value_allowed(self, entry: Folder, value: str, rule_value: str) -> bool:
         return not super().is_value_allowed(entry, value, rule_value)
 
@@ -276,7 +383,7 @@ class ContainsFolderRule(ContainsFileRule):
             before_or_after_values,
             level,
         )
-        self.replace_values = []
+        self.replace_values = ()
 
     def get_generators(self) -> Sequence[Generator]:
         return []
@@ -285,7 +392,7 @@ class ContainsFolderRule(ContainsFileRule):
         names = [folder.name for folder in folder.folders]
         return set(names)
 
-    def get_folders(self, entry: Folder, level: int) -> Iterable[str]:
+    def get_folders(self, entry: Folder, level: int) -> set[str]:
         folders = self.get_folder_names(entry)
         level += 1
         if level >= self.max_level:
@@ -303,7 +410,6 @@ class ContainsFolderRule(ContainsFileRule):
 
 
 class NotContainsFolderRule(ContainsFolderRule):
-    @matched_value()
     def is_value_allowed(self, entry: Folder, value: str, rule_value: str) -> bool:
         return not super().is_value_allowed(entry, value, rule_value)
 
@@ -317,7 +423,7 @@ class ChainedRule(AFilterRule, ISingleRule):
         self.rules = rules
 
     def is_empty(self) -> bool:
-        if len(self.rules) == 0:
+        if not self.rules:
             return True
         return all(rule.is_empty() for rule in self.rules)
 
@@ -326,6 +432,9 @@ class ChainedRule(AFilterRule, ISingleRule):
             return all(rule.is_allowed(entry) for rule in self.rules)
         return any(rule.is_allowed(entry) for rule in self.rules)
 
+    def is_name_rule(self) -> bool:
+        return all(rule.is_name_rule() for rule in self.rules)
+
     def set_before_or_after(self, before_or_after: Iterable[str]) -> None:
         for rule in self.rules:
             rule.set_before_or_after(before_or_after)
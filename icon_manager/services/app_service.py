@@ -84,7 +84,7 @@ class IconsAppService(IServiceProtocol):
                 try:
                     future.result()
                 except Exception as exc:
-                    log.error("%r Exception: %s" % (user_service.user_config, exc))
+                    log.error("%r Exception: %s", user_service.user_config, exc)
 
     def find_existing_content(self):
         for service in self.services:
@@ -99,7 +99,7 @@ class IconsAppService(IServiceProtocol):
                 try:
                     future.result()
                 except Exception as exc:
-                    log.error("%r Exception: %s" % (user_service.user_config, exc))
+                    log.error("%r Exception: %s", user_service.user_config, exc)
 
     def re_apply_matched_icons(self):
         for service in self.services:
@@ -118,4 +118,4 @@ class IconsAppService(IServiceProtocol):
                 try:
                     future.result()
                 except Exception as exc:
-                    log.error("%r Exception: %s" % (user_service.user_config, exc))
+                    log.error("%r Exception: %s", user_service.user_config, exc)
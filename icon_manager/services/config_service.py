@@ -1,5 +1,6 @@
 import logging
 from collections.abc import Iterable
+from collections.abc import Set as AbstractSet
 
 from icon_manager.config.user import UserConfig
 from icon_manager.content.controller.desktop import DesktopIniController
@@ -7,7 +8,8 @@ from icon_manager.content.controller.icon_file import IconFileController
 from icon_manager.content.controller.icon_folder import IconFolderController
 from icon_manager.content.controller.re_apply import ReApplyController
 from icon_manager.content.controller.rules_apply import RulesApplyController
-from icon_manager.crawler.crawler import async_crawling_folders, crawling_icons
+from icon_manager.crawler import filters
+from icon_manager.crawler.crawler import NO_STOP_NAMES, async_crawling_folders, crawling_icons
 from icon_manager.helpers.decorator import execution
 from icon_manager.interfaces.path import File, Folder
 from icon_manager.library.controller import IconLibraryController
@@ -73,7 +75,7 @@ class ConfigService(IConfigService):
     @execution(message='Found & applied icons', start_message='Start find & apply icons')
     def find_and_apply(self):
         settings = self.settings.updated_settings(self._before_or_after)
-        entries = self.crawling_search_folders()
+        entries = self.crawling_search_folders(stop_names=filters.EXCLUDED_FOLDERS)
         entries = self.rules.crawle_and_build_result(entries, self.exclude)
         self.rules.search_and_find_matches(entries, settings)
         self.rules.creating_found_matches(self.exclude)
@@ -82,9 +84,9 @@ class ConfigService(IConfigService):
         message="Crawled through folders (No filtering)",
         start_message="Crawling search folders",
     )
-    def crawling_search_folders(self) -> list[Folder]:
+    def crawling_search_folders(self, stop_names: AbstractSet[str] = NO_STOP_NAMES) -> list[Folder]:
         folders = self.user_config.search_folders
-        return async_crawling_folders(self.user_config, folders)
+        return async_crawling_folders(self.user_config, folders, stop_names)
 
     @execution(message='Crawled through content')
     def find_existing(self):
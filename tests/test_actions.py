@@ -0,0 +1,32 @@
+from unittest.mock import patch
+
+from icon_manager.interfaces.actions import DeleteAction
+from icon_manager.interfaces.path import FileModel, FolderModel, JsonFile
+
+
+class TestDeleteAction:
+    def test_execute_records_deleted_files_and_folders(self, tmp_path):
+        (tmp_path / "config.json").touch()
+        (tmp_path / "folder").mkdir()
+        (tmp_path / "folder" / "nested.json").touch()
+        file = JsonFile(str(tmp_path / "config.json"))
+        folder = FolderModel(str(tmp_path / "folder"))
+
+        action = DeleteAction(None, [file, folder])
+        action.execute()
+
+        assert action.files == [file]
+        assert action.folders == [folder]
+        assert list(tmp_path.iterdir()) == []
+
+    def test_execute_skips_missing_entries_without_stat(self, tmp_path):
+        missing = JsonFile(str(tmp_path / "missing.json"))
+
+        action = DeleteAction(None, [missing])
+        with patch.object(FileModel, "exists") as mock_exists, \
+                patch("icon_manager.interfaces.path.log_exception_once") as mock_log:
+            action.execute()
+
+        assert action.any_executed() is False
+        mock_exists.assert_not_called()
+        mock_log.assert_not_called()
@@ -6,8 +6,14 @@ from icon_manager.config.app import AppConfig, AppConfigFactory, AppConfigs
 from icon_manager.config.user import UserConfig
 from icon_manager.data.json_source import JsonSource
 from icon_manager.interfaces.path import ConfigFile
+from icon_manager.rules.base import Operator, RuleAttribute
 from icon_manager.rules.factory.manager import ExcludeManagerFactory
-from icon_manager.rules.manager import ExcludeManager
+from icon_manager.rules.manager import (
+    AttributeRuleHandler,
+    ConfigRuleController,
+    ExcludeManager,
+)
+from icon_manager.rules.rules import ContainsRule
 
 
 class TestAppConfig:
@@ -36,6 +42,19 @@ class TestAppConfig:
             mock_deepcopy.assert_called_once_with(exclude_rules)
             assert result == mock_deepcopy.return_value
 
+    def test_create_exclude_rules_returns_independent_copy(self):
+        rule = ContainsRule(RuleAttribute.NAME, Operator.ANY, ["temp"], False, False, [])
+        handler = AttributeRuleHandler(RuleAttribute.NAME, Operator.ANY, [rule])
+        exclude_rules = ExcludeManager([ConfigRuleController([handler], Operator.ANY)])
+
+        config = AppConfig([Mock(spec=UserConfig)], exclude_rules, ["before"])
+        result = config.create_exclude_rules()
+
+        assert result is not exclude_rules
+        copied_rule = result.checkers[0].controllers[0].rules[0]
+        assert copied_rule is not rule
+        assert copied_rule.rule_values == rule.rule_values
+
     def test_validate_calls_validate_on_all_user_configs(self):
         user_config1 = Mock(spec=UserConfig)
         user_config2 = Mock(spec=UserConfig)
@@ -65,6 +84,7 @@ class TestAppConfigFactory:
 
     def test_app_config_path_creates_directory_if_not_exists(self):
         test_path = "/test/path"
+        AppConfigFactory.app_config_path.cache_clear()
 
         with patch("icon_manager.config.app.get_converted_env_path") as mock_convert:
             mock_convert.return_value = test_path
@@ -82,6 +102,18 @@ class TestAppConfigFactory:
                         mock_join.assert_called_once_with(test_path, "app_config.config")
                         assert result == "/test/path/app_config.config"
 
+    def test_app_config_path_resolves_folder_once(self, tmp_path):
+        AppConfigFactory.app_config_path.cache_clear()
+        folder = str(tmp_path / "Icon-Manager")
+
+        with patch("os.makedirs") as mock_makedirs:
+            first = AppConfigFactory.app_config_path(folder)
+            second = AppConfigFactory.app_config_path(folder)
+
+        AppConfigFactory.app_config_path.cache_clear()
+        assert first == second
+        mock_makedirs.assert_called_once_with(folder)
+
     def test_app_config_file_returns_config_file_instance(self):
         with patch.object(AppConfigFactory, "app_config_path") as mock_path:
             mock_path.return_value = "/test/config.config"
@@ -99,29 +131,28 @@ class TestAppConfigFactory:
         assert AppConfigFactory.is_user_config_name("app_config.config") is False
         assert AppConfigFactory.is_user_config_name("excluded_rules.config") is False
 
-    def test_get_user_config_paths_filters_and_returns_paths(self, factory):
-        folder_path = "/test/folder"
+    def test_get_user_config_paths_filters_and_returns_paths(self, factory, tmp_path):
+        for name in ["user1.config", "app_config.config", "excluded_rules.config", "user2.config", "other.json"]:
+            (tmp_path / name).touch()
 
-        with patch("icon_manager.config.app.get_files") as mock_get_files:
-            mock_get_files.return_value = [
-                "user1.config",
-                "app_config.config",
-                "user2.config",
-            ]
-            with patch("icon_manager.config.app.get_paths") as mock_get_paths:
-                mock_get_paths.return_value = [
-                    "/test/folder/user1.config",
-                    "/test/folder/user2.config",
-                ]
+        result = AppConfigFactory.get_user_config_paths(str(tmp_path))
+
+        assert sorted(result) == [
+            str(tmp_path / "user1.config"),
+            str(tmp_path / "user2.config"),
+        ]
 
-                result = AppConfigFactory.get_user_config_paths(folder_path)
+    def test_get_exclude_config_returns_path_when_file_exists(self, tmp_path):
+        (tmp_path / "excluded_rules.config").touch()
 
-                mock_get_files.assert_called_once_with(folder_path, ".config")
-                mock_get_paths.assert_called_once_with(folder_path, ["user1.config", "user2.config"])
-                assert result == [
-                    "/test/folder/user1.config",
-                    "/test/folder/user2.config",
-                ]
+        result = AppConfigFactory.get_exclude_config(str(tmp_path))
+
+        assert result == str(tmp_path / "excluded_rules.config")
+
+    def test_get_exclude_config_returns_none_when_missing(self, tmp_path):
+        (tmp_path / "user1.config").touch()
+
+        assert AppConfigFactory.get_exclude_config(str(tmp_path)) is None
 
     def test_create_user_configs_creates_valid_configs(self, factory):
         content = {AppConfigs.USER_CONFIGS: "/test/folder"}
@@ -137,11 +168,12 @@ class TestAppConfigFactory:
             mock_user_config2 = Mock(spec=UserConfig)
             mock_user_config2.has_search_folders.return_value = True
 
+            configs_by_path = {
+                "/test/folder/user1.config": mock_user_config1,
+                "/test/folder/user2.config": mock_user_config2,
+            }
             factory.user_factory = Mock()
-            factory.user_factory.create.side_effect = [
-                mock_user_config1,
-                mock_user_config2,
-            ]
+            factory.user_factory.create.side_effect = lambda file: configs_by_path[file.path]
 
             result = factory.create_user_configs(content)
 
@@ -163,11 +195,12 @@ class TestAppConfigFactory:
             mock_user_config2 = Mock(spec=UserConfig)
             mock_user_config2.has_search_folders.return_value = False
 
+            configs_by_path = {
+                "/test/folder/user1.config": mock_user_config1,
+                "/test/folder/user2.config": mock_user_config2,
+            }
             factory.user_factory = Mock()
-            factory.user_factory.create.side_effect = [
-                mock_user_config1,
-                mock_user_config2,
-            ]
+            factory.user_factory.create.side_effect = lambda file: configs_by_path[file.path]
 
             result = factory.create_user_configs(content)
 
@@ -244,3 +277,23 @@ class TestAppConfigFactory:
                         assert result.user_configs == [mock_user_config]
                         assert result.before_or_after == ["before", "after"]
                         assert result._exclude_rules == mock_exclude_manager
+
+    def test_create_does_not_write_unchanged_app_config(self, factory):
+        mock_file = Mock(spec=ConfigFile)
+        mock_file.exists.return_value = True
+
+        factory.source.read.return_value = {AppConfigs.USER_CONFIGS: "/test/folder"}
+
+        with patch.object(factory, "does_user_config_path_exists") as mock_path_exists:
+            mock_path_exists.return_value = True
+            with patch.object(factory, "does_user_configs_exists") as mock_configs_exist:
+                mock_configs_exist.return_value = True
+                with patch.object(factory, "create_user_configs") as mock_create_users:
+                    mock_create_users.return_value = [Mock(spec=UserConfig)]
+                    with patch.object(factory, "create_exclude_config") as mock_create_exclude:
+                        mock_create_exclude.return_value = Mock(spec=ExcludeManager)
+                        factory.source.write = Mock()
+
+                        factory.create(mock_file)
+
+                        factory.source.write.assert_not_called()
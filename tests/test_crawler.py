@@ -0,0 +1,132 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from icon_manager.config.user import UserConfig
+from icon_manager.crawler.crawler import async_crawling_folders, crawling_icons
+from icon_manager.crawler.filters import folders_by_name
+from icon_manager.crawler.scanner import (
+    FILE_ATTRIBUTE_DIRECTORY,
+    FILE_ATTRIBUTE_REPARSE_POINT,
+    IO_REPARSE_TAG_SYMLINK,
+    FindEntry,
+    scan,
+)
+from icon_manager.interfaces.path import Folder, IconSearchFolder
+
+
+def _names(folder) -> tuple:
+    files = sorted(file.name for file in folder.files)
+    folders = sorted((_names(child) for child in folder.folders), key=lambda child: child[0])
+    return folder.name, files, folders
+
+
+class TestAsyncCrawlingFolders:
+    @pytest.fixture
+    def config(self):
+        config = Mock(spec=UserConfig)
+        config.name = "test_config"
+        return config
+
+    @pytest.fixture
+    def search_folder(self, tmp_path):
+        for sub in ("first", "second/nested"):
+            (tmp_path / sub).mkdir(parents=True)
+        for name in ("root.ico", "first/a.ico", "second/b.txt", "second/nested/c.ico"):
+            (tmp_path / name).touch()
+        root = Mock(spec=IconSearchFolder)
+        root.path = str(tmp_path)
+        return root
+
+    @pytest.mark.parametrize("workers", [1, 8])
+    def test_crawls_complete_tree_with_any_worker_count(self, config, search_folder, tmp_path, workers):
+        with patch("icon_manager.interfaces.actions.MAX_WORKERS", workers):
+            folders = async_crawling_folders(config, [search_folder])
+
+        assert len(folders) == 1
+        assert _names(folders[0]) == (
+            tmp_path.name,
+            ["root.ico"],
+            [
+                ("first", ["a.ico"], []),
+                ("second", ["b.txt"], [("nested", ["c.ico"], [])]),
+            ],
+        )
+
+    def test_does_not_enter_sub_folders_of_stop_names(self, config, search_folder, tmp_path):
+        folders = async_crawling_folders(config, [search_folder], frozenset(["second"]))
+
+        second = next(folder for folder in folders[0].folders if folder.name == "second")
+        assert [file.name for file in second.files] == ["b.txt"]
+        assert second.folders == []
+
+    def test_leaves_out_folders_which_can_not_be_read(self, config, search_folder, tmp_path):
+        unreadable = str(tmp_path / "second")
+
+        def failing_scan(path):
+            if path == unreadable:
+                raise PermissionError(path)
+            return scan(path)
+
+        with patch("icon_manager.crawler.crawler.scan", side_effect=failing_scan):
+            folders = async_crawling_folders(config, [search_folder])
+
+        assert [folder.name for folder in folders[0].folders] == ["first"]
+
+
+class TestCrawlingIcons:
+    def test_groups_only_files_with_wanted_extension(self, tmp_path):
+        (tmp_path / "nested").mkdir()
+        for name in ("a.ico", "a.json", "notes.txt", "nested/b.ico", "nested/.hidden", "nested/.ico", "c.json.txt"):
+            (tmp_path / name).touch()
+        root = Mock(spec=IconSearchFolder)
+        root.path = str(tmp_path)
+
+        result = crawling_icons(root, ["ico", "json"])
+
+        assert sorted(result) == ["ico", "json"]
+        assert sorted(file.name for file in result["ico"]) == ["a.ico", "b.ico"]
+        assert [file.name for file in result["json"]] == ["a.json"]
+
+
+class TestFoldersByName:
+    def test_returns_matching_folders_depth_first(self):
+        root = Folder.from_path("/root", None)
+        first = Folder.from_path("/root/__icon__", root)
+        second = Folder.from_path("/root/sub", root)
+        nested = Folder.from_path("/root/sub/__icon__", second)
+        second.folders.append(nested)
+        root.folders.extend([first, second])
+
+        result = folders_by_name([root], ["__icon__"])
+
+        assert result == [first, nested]
+
+
+class TestScanner:
+    def test_scan_returns_entries_of_folder(self, tmp_path):
+        (tmp_path / "folder").mkdir()
+        (tmp_path / "file.ico").touch()
+
+        entries = {entry.name: entry for entry in scan(str(tmp_path))}
+
+        assert sorted(entries) == ["file.ico", "folder"]
+        assert entries["folder"].is_dir(follow_symlinks=False) is True
+        assert entries["file.ico"].is_file() is True
+        assert entries["file.ico"].path == str(tmp_path / "file.ico")
+
+    def test_find_entry_uses_find_data_attributes(self):
+        folder = FindEntry("/root", "folder", FILE_ATTRIBUTE_DIRECTORY, 0)
+        file = FindEntry("/root", "file.ico", 0x20, 0)
+
+        assert folder.is_dir(follow_symlinks=False) is True
+        assert folder.is_file() is False
+        assert file.is_dir(follow_symlinks=False) is False
+        assert file.is_file() is True
+
+    def test_find_entry_does_not_follow_symlink_folder(self):
+        attributes = FILE_ATTRIBUTE_DIRECTORY | FILE_ATTRIBUTE_REPARSE_POINT
+        link = FindEntry("/root", "link", attributes, IO_REPARSE_TAG_SYMLINK)
+
+        assert link.is_symlink() is True
+        assert link.is_dir(follow_symlinks=False) is False
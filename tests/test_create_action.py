@@ -0,0 +1,76 @@
+from unittest.mock import Mock
+
+import pytest
+
+from icon_manager.config.user import UserConfig
+from icon_manager.content.actions.create import CreateIconAction
+from icon_manager.content.controller.desktop import DesktopIniCreator
+from icon_manager.content.models.desktop import DesktopIniFile
+from icon_manager.content.models.matched import MatchedRuleFolder
+from icon_manager.interfaces.path import IconSearchFolder
+
+
+class TestCreateIconAction:
+    @pytest.fixture
+    def user_config(self):
+        config = Mock(spec=UserConfig)
+        config.name = "test_config"
+        config.copy_icon = False
+        search_folder = Mock(spec=IconSearchFolder)
+        search_folder.copy_icon = None
+        config.search_folder_by.return_value = search_folder
+        return config
+
+    @pytest.fixture
+    def matched_folder(self):
+        folder = Mock(spec=MatchedRuleFolder)
+        folder.path = "/test/folder"
+        folder.desktop_ini = Mock(spec=DesktopIniFile)
+        folder.desktop_ini.exists.return_value = False
+        folder.setting = Mock()
+        folder.setting.copy_icon = None
+        folder.is_file.return_value = False
+        folder.is_dir.return_value = True
+        return folder
+
+    def test_execute_writes_each_folder_once(self, user_config, matched_folder):
+        controller = Mock(spec=DesktopIniCreator)
+        action = CreateIconAction([matched_folder, matched_folder], user_config, controller=controller)
+
+        action.execute()
+
+        controller.write_many.assert_called_once_with([(matched_folder, False)])
+        assert action.folders == [matched_folder]
+
+    def test_execute_action_writes_folder(self, user_config, matched_folder):
+        controller = Mock(spec=DesktopIniCreator)
+        action = CreateIconAction([matched_folder], user_config, controller=controller)
+
+        action.action_execute(matched_folder)
+
+        controller.write.assert_called_once_with(matched_folder, False)
+
+    def test_can_execute_skips_visited_folder(self, user_config, matched_folder):
+        action = CreateIconAction([], user_config, controller=Mock(spec=DesktopIniCreator))
+
+        assert action.can_execute(matched_folder) is True
+        assert action.can_execute(matched_folder) is False
+
+    def test_actions_share_default_creator(self, user_config):
+        first = CreateIconAction([], user_config)
+        second = CreateIconAction([], user_config)
+
+        assert isinstance(first.controller, DesktopIniCreator)
+        assert first.controller is second.controller
+
+    def test_default_creator_checks_existing_app_file(self, user_config, tmp_path):
+        desktop_ini = tmp_path / "desktop.ini"
+        desktop_ini.write_text("[.ShellClassInfo]\r\nIconManager=1\r\n")
+        foreign_ini = tmp_path / "foreign" / "desktop.ini"
+        foreign_ini.parent.mkdir()
+        foreign_ini.write_text("[.ShellClassInfo]\r\nIconResource=icon.ico,0\r\n")
+
+        creator = CreateIconAction([], user_config).controller
+
+        assert creator.can_write(DesktopIniFile(str(desktop_ini))) is True
+        assert creator.can_write(DesktopIniFile(str(foreign_ini))) is False
@@ -1,10 +1,10 @@
+import os
 from unittest.mock import Mock, patch
 
 import pytest
 
 from icon_manager.config.user import UserConfig
 from icon_manager.content.controller.desktop import (
-    DesktopDeleteAction,
     DesktopFileChecker,
     DesktopIniBuilder,
     DesktopIniCommand,
@@ -15,6 +15,7 @@ from icon_manager.content.controller.desktop import (
     RuleFolderCommand,
     error_message,
     get_commands,
+    is_app_content,
 )
 from icon_manager.content.models.desktop import DesktopIniFile, Git
 from icon_manager.content.models.matched import (
@@ -23,7 +24,7 @@ from icon_manager.content.models.matched import (
     MatchedRuleFolder,
 )
 from icon_manager.data.ini_source import DesktopFileSource
-from icon_manager.interfaces.path import File, Folder, PathModel
+from icon_manager.interfaces.path import File, Folder, FolderModel, PathModel
 from icon_manager.library.models import IconSetting, LibraryIconFile
 
 
@@ -44,12 +45,14 @@ class TestDesktopFileChecker:
         mock_file = Mock(spec=File)
         mock_file.path = "/test/desktop.ini"
 
-        mock_source.read.return_value = [
-            "[.ShellClassInfo]",
-            "IconResource=icon.ico,0",
-            "IconManager=1",
-            "[ViewState]",
-        ]
+        mock_source.read_bytes.return_value = b"\r\n".join(
+            [
+                b"[.ShellClassInfo]",
+                b"IconResource=icon.ico,0",
+                b"IconManager=1",
+                b"[ViewState]",
+            ]
+        )
 
         result = checker.is_app_file(mock_file)
 
@@ -59,11 +62,13 @@ class TestDesktopFileChecker:
         mock_file = Mock(spec=File)
         mock_file.path = "/test/desktop.ini"
 
-        mock_source.read.return_value = [
-            "[.ShellClassInfo]",
-            "IconResource=icon.ico,0",
-            "[ViewState]",
-        ]
+        mock_source.read_bytes.return_value = b"\r\n".join(
+            [
+                b"[.ShellClassInfo]",
+                b"IconResource=icon.ico,0",
+                b"[ViewState]",
+            ]
+        )
 
         result = checker.is_app_file(mock_file)
 
@@ -71,14 +76,132 @@ class TestDesktopFileChecker:
 
     def test_is_app_file_handles_desktop_ini_file_input(self, checker, mock_source):
         mock_desktop_file = Mock(spec=DesktopIniFile)
+        mock_desktop_file.path = "/test/desktop.ini"
 
-        mock_source.read.return_value = ["IconManager=1"]
+        mock_source.read_bytes.return_value = b"IconManager=1"
 
         result = checker.is_app_file(mock_desktop_file)
 
         assert result is True
-        mock_source.read.assert_called_once_with(mock_desktop_file)
+        mock_source.read_bytes.assert_called_once_with(mock_desktop_file)
+
+    def test_is_app_file_requires_complete_app_entry_line(self, checker, mock_source):
+        mock_file = Mock(spec=File)
+        mock_file.path = "/test/desktop.ini"
+
+        mock_source.read_bytes.return_value = b"[.ShellClassInfo]\r\nIconManager=10\r\n"
 
+        assert checker.is_app_file(mock_file) is False
+
+    def test_is_app_file_reads_unchanged_file_once(self, checker, mock_source, tmp_path):
+        desktop_ini = tmp_path / "desktop.ini"
+        desktop_ini.write_text("IconManager=1")
+        mock_file = Mock(spec=File)
+        mock_file.path = str(desktop_ini)
+        mock_source.read_bytes.return_value = b"IconManager=1"
+
+        assert checker.is_app_file(mock_file) is True
+        assert checker.is_app_file(mock_file) is True
+
+        mock_source.read_bytes.assert_called_once()
+
+    def test_is_app_file_reads_again_after_file_changed(self, checker, mock_source, tmp_path):
+        desktop_ini = tmp_path / "desktop.ini"
+        desktop_ini.write_text("[.ShellClassInfo]")
+        mock_file = Mock(spec=File)
+        mock_file.path = str(desktop_ini)
+        mock_source.read_bytes.return_value = b"[.ShellClassInfo]"
+
+        assert checker.is_app_file(mock_file) is False
+        desktop_ini.write_text("[.ShellClassInfo]\r\nIconManager=1")
+        mock_source.read_bytes.return_value = b"[.ShellClassInfo]\r\nIconManager=1"
+
+        assert checker.is_app_file(mock_file) is True
+        assert mock_source.read_bytes.call_count == 2
+
+    def test_is_app_file_skips_large_file_without_app_entry(self, checker, mock_source, tmp_path):
+        desktop_ini = tmp_path / "desktop.ini"
+        desktop_ini.write_bytes(b"x" * 8192)
+        mock_file = Mock(spec=File)
+        mock_file.path = str(desktop_ini)
+        mock_source.contains_line.return_value = False
+
+        assert checker.is_app_file(mock_file) is False
+        mock_source.read_bytes.assert_not_called()
+
+    def test_is_app_file_reads_large_app_file_only_mapped(self, tmp_path):
+        desktop_ini = tmp_path / "desktop.ini"
+        desktop_ini.write_bytes(b"; " + b"x" * 8192 + b"\r\nIconManager=1\r\n")
+        source = DesktopFileSource()
+        checker = DesktopFileChecker(source)
+        mock_file = Mock(spec=File)
+        mock_file.path = str(desktop_ini)
+
+        with patch.object(source, "read_bytes") as mock_read:
+            assert checker.is_app_file(mock_file) is True
+
+        mock_read.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "content, expected",
+        [
+            (b"IconManager=1", True),
+            (b"[.ShellClassInfo]\r\n  IconManager=1 \r\nMode=", True),
+            (b"[.ShellClassInfo]\rIconManager=1\rMode=", True),
+            (b"IconManager=10\r\nMyIconManager=1", False),
+            (b"IconManager=10\nIconManager=1", True),
+            (b"", False),
+        ],
+    )
+    def test_is_app_content_matches_whole_line(self, content, expected, tmp_path):
+        desktop_ini = tmp_path / "desktop.ini"
+        desktop_ini.write_bytes(content)
+
+        assert is_app_content(content) is expected
+        assert DesktopFileSource().contains_line(DesktopIniFile(str(desktop_ini)), b"IconManager=1") is expected
+
+
+class TestDesktopModels:
+    def test_is_model_matches_only_exact_file_name(self):
+        assert DesktopIniFile.is_model("/test/desktop.ini") is True
+        assert DesktopIniFile.is_model("/test/my-desktop.ini") is False
+        assert Git.is_model("/test/project/.git") is True
+        assert Git.is_model("/test/project.git") is False
+
+    def test_is_model_matches_only_exact_folder_name(self):
+        assert MatchedIconFolder.is_model("/test/__icon__") is True
+        assert MatchedIconFolder.is_model("/test/old__icon__") is False
+
+
+class TestMatchedRuleFolder:
+    @pytest.fixture
+    def rule_folder(self, tmp_path):
+        setting = Mock(spec=IconSetting)
+        setting.icon = LibraryIconFile(str(tmp_path / "library" / "python.ico"))
+        return MatchedRuleFolder(FolderModel(str(tmp_path / "project")), setting)
+
+    def test_child_models_are_built_once(self, rule_folder):
+        assert rule_folder.desktop_ini is rule_folder.desktop_ini
+        assert rule_folder.local_icon is rule_folder.local_icon
+
+    def test_icon_path_checks_local_icon_on_every_call(self, rule_folder, tmp_path):
+        assert rule_folder.icon_path_for_desktop_ini() == str(tmp_path / "library" / "python.ico")
+
+        (tmp_path / "project" / "__icon__").mkdir(parents=True)
+        (tmp_path / "project" / "__icon__" / "python.ico").touch()
+
+        assert rule_folder.icon_path_for_desktop_ini() == os.path.join("__icon__", "python.ico")
+
+
+    def test_icon_path_is_relative_without_relpath(self, rule_folder, tmp_path):
+        (tmp_path / "project" / "__icon__").mkdir(parents=True)
+        (tmp_path / "project" / "__icon__" / "python.ico").touch()
+
+        with patch("os.path.relpath") as mock_relpath:
+            result = rule_folder.icon_path_for_desktop_ini()
+
+        assert result == os.path.join("__icon__", "python.ico")
+        mock_relpath.assert_not_called()
 
 class TestDesktopIniBuilder:
     @pytest.fixture
@@ -132,42 +255,20 @@ class TestDesktopIniBuilder:
         assert isinstance(result, DesktopIniFile)
         assert result.path == "/test/desktop.ini"
 
+    def test_build_models_keeps_order_when_built_in_parallel(self, builder):
+        files = []
+        for index in range(DesktopIniBuilder.parallel_threshold + 1):
+            mock_file = Mock(spec=File)
+            mock_file.path = f"/test/{index}/desktop.ini"
+            mock_file.excluded = False
+            mock_file.is_dir.return_value = False
+            files.append(mock_file)
+        builder.checker.is_app_file = Mock(side_effect=lambda file: not file.path.startswith("/test/1"))
 
-class TestDesktopDeleteAction:
-    @pytest.fixture
-    def mock_checker(self):
-        return Mock(spec=DesktopFileChecker)
-
-    @pytest.fixture
-    def delete_action(self, mock_checker):
-        mock_entries = [Mock(spec=PathModel), Mock(spec=PathModel)]
-        return DesktopDeleteAction(mock_entries, mock_checker)
-
-    def test_init_creates_action_with_entries_and_checker(self, mock_checker):
-        mock_entries = [Mock(spec=PathModel)]
-        action = DesktopDeleteAction(mock_entries, mock_checker)
-
-        assert action.entries == mock_entries
-        assert action.checker == mock_checker
+        result = builder.build_models(files)
 
-    def test_can_execute_returns_true_when_app_file_and_exists(self, delete_action, mock_checker):
-        mock_entry = Mock(spec=PathModel)
-        mock_entry.exists.return_value = True
-        mock_checker.is_app_file.return_value = True
-
-        result = delete_action.can_execute(mock_entry)
-
-        assert result is True
-        mock_checker.is_app_file.assert_called_once_with(mock_entry)
-
-    def test_can_execute_returns_false_when_not_app_file(self, delete_action, mock_checker):
-        mock_entry = Mock(spec=PathModel)
-        mock_entry.exists.return_value = True
-        mock_checker.is_app_file.return_value = False
-
-        result = delete_action.can_execute(mock_entry)
-
-        assert result is False
+        expected = [file.path for file in files if not file.path.startswith("/test/1")]
+        assert [model.path for model in result] == expected
 
 
 class TestDesktopIniController:
@@ -204,18 +305,15 @@ class TestDesktopIniController:
 
         controller.crawle_and_build_result(mock_folders, mock_settings)
 
-        mock_files_by_ext.assert_called_once_with(mock_folders, ["ini"])
+        mock_files_by_ext.assert_called_once_with(mock_folders, ("ini",))
         controller.builder.build_models.assert_called_once_with(mock_files)
         assert controller.desktop_files == mock_desktop_files
 
-    @patch("icon_manager.content.controller.desktop.DesktopDeleteAction")
-    @patch("icon_manager.content.controller.desktop.DesktopFileChecker")
-    def test_delete_content_executes_delete_action(self, mock_checker_class, mock_action_class, controller):
+    @patch("icon_manager.content.controller.desktop.DeleteAction")
+    def test_delete_content_executes_delete_action(self, mock_action_class, controller):
         mock_desktop_files = [Mock(spec=DesktopIniFile)]
         controller.desktop_files = mock_desktop_files
 
-        mock_checker = Mock()
-        mock_checker_class.return_value = mock_checker
         mock_action = Mock()
         mock_action.any_executed.return_value = True
         mock_action.get_log_message.return_value = "Deleted files"
@@ -223,12 +321,17 @@ class TestDesktopIniController:
 
         controller.delete_content()
 
-        mock_action_class.assert_called_once_with(mock_desktop_files, mock_checker)
-        mock_action.execute.assert_called_once()
+        mock_action_class.assert_called_once_with(controller.user_config, mock_desktop_files)
+        mock_action.async_execute.assert_called_once()
         mock_action.get_log_message.assert_called_once_with(DesktopIniFile)
 
 
 class TestConfigCommands:
+    def test_commands_have_no_instance_dict(self):
+        command = IconFolderCommand(2, True, Mock(spec=MatchedIconFolder))
+
+        assert not hasattr(command, "__dict__")
+
     def test_error_message_formats_correctly(self):
         mock_model = Mock(spec=PathModel)
         mock_model.name = "test_folder"
@@ -302,6 +405,30 @@ class TestConfigCommands:
 
         mock_icon_folder.set_hidden.assert_called_once_with(is_hidden=True)
 
+    def test_icon_folder_command_checks_existence_once(self):
+        mock_icon_folder = Mock(spec=MatchedIconFolder)
+        mock_icon_folder.exists.return_value = True
+
+        command = IconFolderCommand(2, True, mock_icon_folder)
+        command.pre_command()
+        command.post_command()
+
+        mock_icon_folder.exists.assert_called_once()
+        mock_icon_folder.create.assert_not_called()
+        mock_icon_folder.set_hidden.assert_called_once_with(is_hidden=True)
+
+    def test_icon_file_command_post_command_uses_copied_icon(self):
+        mock_icon = Mock(spec=MatchedIconFile)
+        mock_icon.exists.return_value = False
+        mock_library = Mock(spec=LibraryIconFile)
+
+        command = IconFileCommand(3, True, mock_icon, mock_library)
+        command.pre_command()
+        command.post_command()
+
+        mock_icon.exists.assert_called_once()
+        mock_icon.set_hidden.assert_called_once_with(is_hidden=True)
+
     def test_icon_file_command_pre_command_copies_library_icon(self):
         mock_icon = Mock(spec=MatchedIconFile)
         mock_icon.exists.return_value = False
@@ -371,7 +498,15 @@ class TestDesktopIniCreator:
 
         assert creator.source == mock_source
         assert isinstance(creator.checker, DesktopFileChecker)
-        assert creator.commands == []
+
+    def test_init_shares_default_source(self):
+        assert DesktopIniCreator().source is DesktopIniCreator().source
+
+    def test_init_shares_default_checker_with_builder(self):
+        creator = DesktopIniCreator()
+
+        assert creator.checker is DesktopIniBuilder().checker
+        assert creator.checker is DesktopIniController(Mock(spec=UserConfig)).builder.checker
 
     def test_can_write_returns_true_for_non_existing_file(self, creator):
         mock_file = Mock(spec=DesktopIniFile)
@@ -403,7 +538,7 @@ class TestDesktopIniCreator:
         mock_manager = Mock(spec=MatchedRuleFolder)
         mock_manager.icon_path_for_desktop_ini.return_value = "icon.ico"
 
-        result = list(creator.create_content(mock_manager))
+        result = creator.create_content(mock_manager)
 
         expected = [
             "[.ShellClassInfo]",
@@ -414,32 +549,27 @@ class TestDesktopIniCreator:
             "Vid=",
             "FolderType=Generic",
         ]
-        assert result == expected
+        assert result == "\r\n".join(expected)
 
-    def test_order_commands_sorts_by_order(self, creator):
+    def test_execute_pre_commands_calls_pre_command_on_all_commands(self, creator):
         mock_cmd1 = Mock()
-        mock_cmd1.order = 3
         mock_cmd2 = Mock()
-        mock_cmd2.order = 1
-        mock_cmd3 = Mock()
-        mock_cmd3.order = 2
 
-        creator.commands = [mock_cmd1, mock_cmd2, mock_cmd3]
-        creator.order_commands(reverse=False)
+        creator.execute_pre_commands([mock_cmd1, mock_cmd2])
 
-        assert creator.commands[0].order == 1
-        assert creator.commands[1].order == 2
-        assert creator.commands[2].order == 3
+        mock_cmd1.pre_command.assert_called_once()
+        mock_cmd2.pre_command.assert_called_once()
+        mock_cmd1.post_command.assert_not_called()
 
-    def test_execute_commands_calls_function_on_all_commands(self, creator):
+    def test_execute_post_commands_calls_post_command_on_all_commands(self, creator):
         mock_cmd1 = Mock()
         mock_cmd2 = Mock()
-        creator.commands = [mock_cmd1, mock_cmd2]
 
-        creator.execute_commands("pre_command")
+        creator.execute_post_commands([mock_cmd1, mock_cmd2])
 
-        mock_cmd1.pre_command.assert_called_once()
-        mock_cmd2.pre_command.assert_called_once()
+        mock_cmd1.post_command.assert_called_once()
+        mock_cmd2.post_command.assert_called_once()
+        mock_cmd1.pre_command.assert_not_called()
 
     @patch("icon_manager.content.controller.desktop.get_commands")
     def test_write_executes_full_workflow(self, mock_get_commands, creator):
@@ -447,7 +577,7 @@ class TestDesktopIniCreator:
         mock_folder.desktop_ini = Mock(spec=DesktopIniFile)
         mock_folder.icon_path_for_desktop_ini.return_value = "icon.ico"
 
-        mock_commands = [Mock(), Mock()]
+        mock_commands = (Mock(), Mock())
         for i, cmd in enumerate(mock_commands):
             cmd.order = i + 1
         mock_get_commands.return_value = mock_commands
@@ -462,3 +592,49 @@ class TestDesktopIniCreator:
         for cmd in mock_commands:
             cmd.pre_command.assert_called_once()
             cmd.post_command.assert_called_once()
+
+    @patch("icon_manager.content.controller.desktop.get_commands")
+    def test_write_runs_post_commands_in_reverse_order(self, mock_get_commands, creator):
+        mock_folder = Mock(spec=MatchedRuleFolder)
+        mock_folder.desktop_ini = Mock(spec=DesktopIniFile)
+        mock_folder.icon_path_for_desktop_ini.return_value = "icon.ico"
+
+        calls = []
+        mock_commands = (Mock(), Mock())
+        for index, cmd in enumerate(mock_commands):
+            cmd.pre_command.side_effect = lambda index=index: calls.append(("pre", index))
+            cmd.post_command.side_effect = lambda index=index: calls.append(("post", index))
+        mock_get_commands.return_value = mock_commands
+
+        creator.write(mock_folder, True)
+
+        assert calls == [("pre", 0), ("pre", 1), ("post", 1), ("post", 0)]
+
+    @patch("icon_manager.content.controller.desktop.get_commands")
+    def test_write_many_runs_each_phase_for_all_folders(self, mock_get_commands, creator):
+        calls = []
+        folders = []
+        commands_of = {}
+        for name in ("first", "second"):
+            folder = Mock(spec=MatchedRuleFolder)
+            folder.name = name
+            folder.desktop_ini = Mock(spec=DesktopIniFile)
+            folder.icon_path_for_desktop_ini.return_value = "icon.ico"
+            command = Mock()
+            command.pre_command.side_effect = lambda name=name: calls.append(("pre", name))
+            command.post_command.side_effect = lambda name=name: calls.append(("post", name))
+            commands_of[name] = (command,)
+            folders.append(folder)
+        mock_get_commands.side_effect = lambda folder, _: commands_of[folder.name]
+        creator.source.write.side_effect = lambda ini, _: calls.append(("write", ini))
+
+        creator.write_many([(folder, True) for folder in folders])
+
+        assert calls == [
+            ("pre", "first"),
+            ("pre", "second"),
+            ("write", folders[0].desktop_ini),
+            ("write", folders[1].desktop_ini),
+            ("post", "first"),
+            ("post", "second"),
+        ]
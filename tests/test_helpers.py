@@ -1,8 +1,21 @@
 from unittest.mock import Mock, patch
 
+import pytest
+
+from icon_manager.helpers.attributes import (
+    FILE_ATTRIBUTE_NORMAL,
+    merge_attributes,
+    set_file_attributes,
+)
+from icon_manager.helpers.environment import (
+    contains_env_var,
+    get_converted_env_path,
+    get_env_path,
+)
 from icon_manager.helpers.path import (
     count_of,
     count_of_recursive,
+    get_file_paths,
     get_files,
     get_path,
     get_paths,
@@ -20,6 +33,7 @@ from icon_manager.helpers.string import (
     list_value,
     prefix_value,
 )
+from icon_manager.helpers.throttle import log_exception_once
 from icon_manager.interfaces.path import File, Folder
 
 
@@ -103,17 +117,22 @@ class TestPathHelpers:
 
         assert result is False
 
-    def test_get_files_returns_files_with_extension(self):
-        with patch("os.listdir") as mock_listdir:
-            mock_listdir.return_value = ["file1.txt", "file2.pdf", "file3.txt"]
-            with patch("icon_manager.helpers.path.is_file") as mock_is_file:
-                mock_is_file.side_effect = lambda path, name, ext: name.endswith(ext or "")
+    def test_get_files_returns_files_with_extension(self, tmp_path):
+        for name in ["file1.txt", "file2.pdf", "file3.txt"]:
+            (tmp_path / name).touch()
+        (tmp_path / "folder.txt").mkdir()
+
+        result = get_files(str(tmp_path), ".txt")
+
+        assert sorted(result) == ["file1.txt", "file3.txt"]
 
-                result = get_files("/test/path", ".txt")
+    def test_get_file_paths_returns_full_paths(self, tmp_path):
+        (tmp_path / "file1.txt").touch()
+        (tmp_path / "file2.pdf").touch()
 
-                assert len(result) == 2
-                assert "file1.txt" in result
-                assert "file3.txt" in result
+        result = get_file_paths(str(tmp_path), "txt")
+
+        assert result == [str(tmp_path / "file1.txt")]
 
     def test_count_of_returns_folder_and_file_count(self):
         folder = Mock(spec=Folder)
@@ -137,6 +156,27 @@ class TestPathHelpers:
 
         assert result == [(1, 2), (0, 1)]
 
+    def test_count_of_recursive_keeps_depth_first_order(self):
+        leaf = Mock(spec=Folder)
+        leaf.folders = []
+        leaf.files = [Mock(), Mock(), Mock()]
+
+        first = Mock(spec=Folder)
+        first.folders = [leaf]
+        first.files = []
+
+        second = Mock(spec=Folder)
+        second.folders = []
+        second.files = [Mock()]
+
+        folder = Mock(spec=Folder)
+        folder.folders = [first, second]
+        folder.files = []
+
+        result = list(count_of_recursive(folder))
+
+        assert result == [(2, 0), (1, 0), (0, 3), (0, 1)]
+
     def test_total_count_sums_all_counts(self):
         folder1 = Mock(spec=Folder)
         folder1.folders = [Mock()]
@@ -154,6 +194,84 @@ class TestPathHelpers:
             assert result == (1, 3)
 
 
+class TestAttributeHelpers:
+    def test_merge_attributes_sets_and_clears_flags(self):
+        hidden_and_system = merge_attributes(0x20, {"s": "+", "h": "+"})
+        assert hidden_and_system == 0x20 | 0x4 | 0x2
+
+        visible = merge_attributes(hidden_and_system, {"s": "-", "h": "-"})
+        assert visible == 0x20
+
+    def test_merge_attributes_keeps_only_settable_flags(self):
+        directory = 0x10
+        result = merge_attributes(directory | 0x2, {"r": "+"})
+        assert result == 0x2 | 0x1
+
+    def test_merge_attributes_returns_normal_without_flags(self):
+        assert merge_attributes(0x1, {"r": "-"}) == FILE_ATTRIBUTE_NORMAL
+
+    def test_set_file_attributes_returns_false_without_windows_api(self, tmp_path):
+        with patch("icon_manager.helpers.attributes._set_file_attributes", None):
+            assert set_file_attributes(str(tmp_path), {"h": "+"}) is False
+
+
+class TestEnvironmentHelpers:
+    def test_get_converted_env_path_replaces_every_variable(self, monkeypatch):
+        monkeypatch.setenv("ICON_ROOT", "/icons")
+        monkeypatch.setenv("ICON_USER", "tester")
+
+        result = get_converted_env_path("%ICON_ROOT%/users/%ICON_USER%")
+
+        assert result == "/icons/users/tester"
+
+    def test_get_converted_env_path_keeps_unknown_variables(self, monkeypatch):
+        monkeypatch.setenv("ICON_ROOT", "/icons")
+        monkeypatch.delenv("ICON_MISSING", raising=False)
+
+        result = get_converted_env_path("%ICON_ROOT%/%ICON_MISSING%/100%%")
+
+        assert result == "/icons/%ICON_MISSING%/100%%"
+
+    def test_get_env_path_raises_error_without_leading_variable(self):
+        with pytest.raises(LookupError):
+            get_env_path("/no/variable")
+
+    def test_contains_env_var_returns_false_for_unknown_variable(self, monkeypatch):
+        monkeypatch.delenv("ICON_MISSING", raising=False)
+
+        assert contains_env_var("%ICON_MISSING%/folder") is False
+
+    def test_contains_env_var_checks_every_variable(self, monkeypatch):
+        monkeypatch.delenv("ICON_MISSING", raising=False)
+        monkeypatch.setenv("ICON_USER", "tester")
+
+        assert contains_env_var("%ICON_MISSING%/%ICON_USER%") is True
+
+
+class TestThrottleHelpers:
+    def test_log_exception_once_logs_traceback_only_for_first_error(self):
+        logger = Mock()
+        for _ in range(3):
+            try:
+                raise PermissionError("read only")
+            except PermissionError as ex:
+                log_exception_once(logger, "TestThrottleHelpers", "set attribute", ex)
+
+        logger.exception.assert_called_once_with("set attribute")
+        assert logger.warning.call_count == 2
+
+    def test_log_exception_once_logs_each_error_type(self):
+        logger = Mock()
+        for error in (OSError, ValueError):
+            try:
+                raise error()
+            except error as ex:
+                log_exception_once(logger, "TestThrottleHelpersTypes", "create folder", ex)
+
+        assert logger.exception.call_count == 2
+        logger.warning.assert_not_called()
+
+
 class TestStringHelpers:
     def test_fixed_length_formats_string_with_defaults(self):
         result = fixed_length("test", 10)
@@ -0,0 +1,57 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from icon_manager.config.user import UserConfig
+from icon_manager.content.controller.icon_file import IconFileBuilder, IconFileController
+from icon_manager.interfaces.path import File, Folder
+from icon_manager.library.models import IconSetting
+
+
+class TestIconFileBuilder:
+    @pytest.fixture
+    def builder(self):
+        builder = IconFileBuilder()
+        settings = []
+        for name in ("first.ico", "second.ico"):
+            setting = Mock(spec=IconSetting)
+            setting.icon = Mock()
+            setting.icon.name = name
+            settings.append(setting)
+        builder.setup(settings=settings)
+        return builder
+
+    def test_setup_collects_icon_names(self, builder):
+        assert builder.icons_names == frozenset({"first.ico", "second.ico"})
+
+    def test_can_build_file_returns_true_for_library_icon(self, builder):
+        file = Mock(spec=File)
+        file.name = "second.ico"
+
+        assert builder.can_build_file(file) is True
+
+    def test_can_build_file_returns_false_for_other_file(self, builder):
+        file = Mock(spec=File)
+        file.name = "other.ico"
+
+        assert builder.can_build_file(file) is False
+
+    def test_build_models_does_not_stat_crawled_nodes(self, builder):
+        folder = Folder.from_path("/test/__icon__", None)
+        files = [File.from_path("/test/__icon__/first.ico", folder), File.from_path("/test/other.ico", None)]
+
+        with patch("os.path.isdir") as mock_isdir, patch("os.path.isfile") as mock_isfile:
+            result = builder.build_models(files)
+
+        assert [model.path for model in result] == ["/test/__icon__/first.ico"]
+        mock_isdir.assert_not_called()
+        mock_isfile.assert_not_called()
+
+
+class TestIconFileController:
+    def test_init_creates_own_default_builder(self):
+        first = IconFileController(Mock(spec=UserConfig))
+        second = IconFileController(Mock(spec=UserConfig))
+
+        assert isinstance(first.builder, IconFileBuilder)
+        assert first.builder is not second.builder
@@ -0,0 +1,69 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from icon_manager.data import json_source
+from icon_manager.data.json_source import JsonSource
+from icon_manager.interfaces.path import JsonFile
+
+
+class TestJsonSource:
+    @pytest.fixture
+    def config(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"values": ["a"]}))
+        yield JsonFile(str(path))
+        json_source._parse_cache.pop(str(path), None)
+
+    def test_read_parses_unchanged_file_once(self, config):
+        source = JsonSource()
+
+        with patch.object(json_source, "_loads", wraps=json_source._loads) as mock_loads:
+            first = source.read(config)
+            second = source.read(config)
+
+        assert mock_loads.call_count == 1
+        assert first == second == {"values": ["a"]}
+
+    def test_read_returns_copy_of_cached_content(self, config):
+        source = JsonSource()
+
+        source.read(config)["values"].append("b")
+
+        assert source.read(config) == {"values": ["a"]}
+
+    def test_read_parses_again_if_mtime_changed(self, config):
+        source = JsonSource()
+        source.read(config)
+        stat = os.stat(config.path)
+        with open(config.path, mode="w") as config_file:
+            json.dump({"values": ["b"]}, config_file)
+        os.utime(config.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert source.read(config) == {"values": ["b"]}
+
+    def test_read_parses_again_if_size_changed(self, config):
+        source = JsonSource()
+        source.read(config)
+        stat = os.stat(config.path)
+        with open(config.path, mode="w") as config_file:
+            json.dump({"values": ["a", "b"]}, config_file)
+        os.utime(config.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert source.read(config) == {"values": ["a", "b"]}
+
+    def test_write_drops_cached_content(self, config):
+        source = JsonSource()
+        source.read(config)
+
+        source.write(config, {"values": ["c"]})
+
+        assert config.path not in json_source._parse_cache
+        assert source.read(config) == {"values": ["c"]}
+
+    def test_read_does_not_create_files_next_to_config(self, config, tmp_path):
+        JsonSource().read(config)
+
+        assert [path.name for path in tmp_path.iterdir()] == ["config.json"]
@@ -409,7 +409,7 @@ class TestIconLibraryController:
 
         expected_configs = [mock_setting1.manager.config, mock_setting2.manager.config]
         mock_action_class.assert_called_once_with(expected_configs)
-        mock_action.execute.assert_called_once()
+        mock_action.async_execute.assert_called_once()
 
     def test_archive_library_archives_empty_settings(self, controller):
         mock_setting1 = Mock(spec=IconSetting)
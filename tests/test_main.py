@@ -0,0 +1,54 @@
+import pytest
+
+from icon_manager.__main__ import (
+    create_parser,
+    get_namespace_from_args,
+    namespace_from_argv,
+)
+
+
+class TestNamespaceFromArgv:
+    @pytest.mark.parametrize(
+        "args",
+        [
+            [],
+            ["--library", "--create"],
+            ["-l", "-a", "-r", "-u", "-d", "-v"],
+            ["--content", "--re-create", "--update", "--delete", "--archive", "--verbose"],
+            ["-c", "-j", "4"],
+            ["--jobs", "1", "--content"],
+        ],
+    )
+    def test_scan_equals_parser(self, args):
+        expected = create_parser().parse_args(args)
+
+        result = namespace_from_argv(args)
+
+        assert result is not None
+        assert vars(result) == vars(expected)
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["--jobs=4"],
+            ["-la"],
+            ["--unknown"],
+            ["-h"],
+            ["-j"],
+            ["-j", "²"],
+            ["-j", "-1"],
+        ],
+    )
+    def test_scan_leaves_other_arguments_to_parser(self, args):
+        assert namespace_from_argv(args) is None
+
+    @pytest.mark.parametrize("args", [["--jobs=4"], ["-la"], ["-c", "-j", "-1"]])
+    def test_get_namespace_falls_back_to_parser(self, args):
+        expected = create_parser().parse_args(args)
+
+        assert vars(get_namespace_from_args(args)) == vars(expected)
+
+    @pytest.mark.parametrize("args", [["--unknown"], ["-h"], ["-j", "²"]])
+    def test_get_namespace_lets_parser_exit(self, args):
+        with pytest.raises(SystemExit):
+            get_namespace_from_args(args)
@@ -0,0 +1,66 @@
+from unittest.mock import patch
+
+import pytest
+
+from icon_manager.rules import matcher
+from icon_manager.rules.matcher import (
+    AutomatonMatcher,
+    PatternMatcher,
+    SubstringMatcher,
+    create_matcher,
+)
+
+
+@pytest.fixture(params=["automaton", "pattern"])
+def backend(request):
+    if request.param == "automaton":
+        pytest.importorskip("ahocorasick")
+        yield AutomatonMatcher
+        return
+    with patch.object(matcher, "ahocorasick", None):
+        yield PatternMatcher
+
+
+class TestCreateMatcher:
+    def test_uses_backend_for_several_values(self, backend):
+        assert type(create_matcher(["python", "django"])) is backend
+
+    @pytest.mark.parametrize("values", [[], ["python"], ["python", ""]])
+    def test_falls_back_to_substrings(self, backend, values):
+        assert type(create_matcher(values)) is SubstringMatcher
+
+
+class TestMatchers:
+    @pytest.mark.parametrize("matcher_type", [SubstringMatcher, PatternMatcher, AutomatonMatcher])
+    def test_contains_any_and_all(self, matcher_type):
+        if matcher_type is AutomatonMatcher:
+            pytest.importorskip("ahocorasick")
+        value_matcher = matcher_type(["python", "django"])
+
+        assert value_matcher.contains_any("my-django-site") is True
+        assert value_matcher.contains_any("my-flask-site") is False
+        assert value_matcher.contains_all("python-django") is True
+        assert value_matcher.contains_all("my-django-site") is False
+
+    def test_substring_matcher_matches_empty_value_everywhere(self):
+        value_matcher = SubstringMatcher(["", "python"])
+
+        assert value_matcher.contains_any("anything") is True
+        assert value_matcher.contains_all("anything") is False
+
+    def test_pattern_matcher_escapes_values(self):
+        value_matcher = PatternMatcher(["c++", "a.b"])
+
+        assert value_matcher.contains_any("my-c++-lib") is True
+        assert value_matcher.contains_any("lib-a.b") is True
+        assert value_matcher.contains_any("abb") is False
+        assert value_matcher.contains_any("cc") is False
+        assert value_matcher.contains_all("c++ and a.b") is True
+        assert value_matcher.contains_all("c++ and abb") is False
+
+    def test_automaton_matcher_counts_each_value_once(self):
+        pytest.importorskip("ahocorasick")
+        value_matcher = AutomatonMatcher(["py", "thon"])
+
+        assert value_matcher.contains_all("pypy") is False
+        assert value_matcher.contains_all("python") is True
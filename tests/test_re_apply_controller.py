@@ -0,0 +1,48 @@
+from unittest.mock import Mock
+
+import pytest
+
+from icon_manager.content.controller.icon_folder import IconFolderController
+from icon_manager.content.controller.re_apply import ReApplyController
+from icon_manager.content.models.matched import MatchedIconFolder, MatchedRuleFolder
+from icon_manager.library.controller import IconLibraryController
+from icon_manager.library.models import IconSetting
+
+
+class TestReApplyController:
+    @pytest.fixture
+    def setting(self):
+        return Mock(spec=IconSetting)
+
+    @pytest.fixture
+    def controller(self, setting):
+        settings = Mock(spec=IconLibraryController)
+        settings.setting_by_icon.side_effect = lambda icon: setting if icon.name == "known.ico" else None
+        icon_folders = Mock(spec=IconFolderController)
+        return ReApplyController(settings, icon_folders)
+
+    def _icon_folder(self, path: str, *names: str) -> MatchedIconFolder:
+        folder = Mock(spec=MatchedIconFolder)
+        folder.parent_path = path
+        icons = []
+        for name in names:
+            icon = Mock()
+            icon.name = name
+            icons.append(icon)
+        folder.get_icons.return_value = icons
+        return folder
+
+    def test_get_rule_folders_scans_every_icon_folder_once(self, controller, setting):
+        matched = self._icon_folder("/test/matched", "other.ico", "known.ico")
+        unknown = self._icon_folder("/test/unknown", "other.ico")
+        empty = self._icon_folder("/test/empty")
+        controller.icon_folders.folders = [matched, unknown, empty]
+
+        result = list(controller.get_rule_folders())
+
+        assert len(result) == 1
+        assert isinstance(result[0], MatchedRuleFolder)
+        assert result[0].path == "/test/matched"
+        assert result[0].setting is setting
+        for folder in (matched, unknown, empty):
+            folder.get_icons.assert_called_once()
@@ -88,10 +88,10 @@ class TestAttributeCheckerFactory:
 
         assert result == []
 
-    @patch("icon_manager.rules.factory.manager.pop_operator")
-    def test_create_builds_attribute_checker(self, mock_pop_operator, factory):
+    @patch("icon_manager.rules.factory.manager.get_operator")
+    def test_create_builds_attribute_checker(self, mock_get_operator, factory):
         config = {"operator": "any", "rules": []}
-        mock_pop_operator.return_value = Operator.ANY
+        mock_get_operator.return_value = Operator.ANY
 
         with patch.object(factory, "create_rules") as mock_create_rules:
             mock_rules = [Mock(spec=ISingleRule)]
@@ -145,10 +145,10 @@ class TestSourceCheckerBuilder:
         assert result == [mock_checker1, mock_checker2]
         assert builder.factory.create.call_count == 2
 
-    @patch("icon_manager.rules.factory.manager.pop_operator")
-    def test_create_builds_rule_checker(self, mock_pop_operator, builder):
+    @patch("icon_manager.rules.factory.manager.get_operator")
+    def test_create_builds_rule_checker(self, mock_get_operator, builder):
         config = {"operator": "all", "path": {}, "name": {}}
-        mock_pop_operator.return_value = Operator.ALL
+        mock_get_operator.return_value = Operator.ALL
 
         mock_checkers = [Mock(spec=AttributeChecker)]
         with patch.object(builder, "get_attribute_checkers") as mock_get_checkers:
@@ -0,0 +1,116 @@
+from unittest.mock import patch
+
+import pytest
+
+from icon_manager.interfaces.path import Folder
+from icon_manager.rules import matcher
+from icon_manager.rules.base import Operator, RuleAttribute
+from icon_manager.rules.rules import (
+    ContainsRule,
+    EndsWithRule,
+    NotContainsRule,
+    StartsOrEndsWithRule,
+    StartsWithRule,
+)
+
+
+def _rule(rule_type, values, before_or_after_values=(), operator=Operator.ANY, case_sensitive=False):
+    rule = rule_type(RuleAttribute.NAME, operator, values, case_sensitive,
+                     bool(before_or_after_values), before_or_after_values)
+    rule.set_before_or_after(before_or_after_values)
+    rule.setup_filter_rule()
+    return rule
+
+
+class TestAffixRules:
+    @pytest.mark.parametrize(
+        "rule_type, name, expected",
+        [
+            (StartsWithRule, "Python-Project", True),
+            (StartsWithRule, "my-python", False),
+            (EndsWithRule, "my-python", True),
+            (EndsWithRule, "Python-Project", False),
+            (StartsOrEndsWithRule, "python-project", True),
+            (StartsOrEndsWithRule, "django-app", True),
+            (StartsOrEndsWithRule, "my-python-app", False),
+        ],
+    )
+    def test_is_allowed_checks_every_rule_value(self, rule_type, name, expected):
+        rule = _rule(rule_type, ["python", "django"])
+
+        assert rule.is_allowed(Folder.from_path(f"/root/{name}", None)) is expected
+
+    def test_is_allowed_checks_generated_values(self):
+        rule = _rule(StartsWithRule, ["python"], ["_"])
+
+        assert rule.is_allowed(Folder.from_path("/root/_python", None)) is True
+        assert rule.is_allowed(Folder.from_path("/root/-python", None)) is False
+
+    def test_is_allowed_lowers_folder_attribute_once(self):
+        rule = _rule(StartsWithRule, ["python"])
+        folder = Folder.from_path("/root/Python-Project", None)
+
+        assert rule.is_allowed(folder) is True
+        folder.name = "Django-App"
+
+        assert folder.lowered_name == "python-project"
+        assert rule.is_allowed(folder) is True
+
+
+@pytest.fixture(params=["automaton", "pattern"])
+def matcher_backend(request):
+    if request.param == "automaton":
+        pytest.importorskip("ahocorasick")
+        yield request.param
+        return
+    with patch.object(matcher, "ahocorasick", None):
+        yield request.param
+
+
+def _folder(name):
+    return Folder.from_path(f"/root/{name}", None)
+
+
+class TestContainsRules:
+    @pytest.mark.parametrize(
+        "rule_type, operator, name, expected",
+        [
+            (ContainsRule, Operator.ANY, "my-django-site", True),
+            (ContainsRule, Operator.ANY, "my-flask-site", False),
+            (ContainsRule, Operator.ALL, "python-django", True),
+            (ContainsRule, Operator.ALL, "my-django-site", False),
+            (NotContainsRule, Operator.ANY, "my-django-site", True),
+            (NotContainsRule, Operator.ANY, "python-django", False),
+            (NotContainsRule, Operator.ALL, "my-flask-site", True),
+            (NotContainsRule, Operator.ALL, "my-django-site", False),
+        ],
+    )
+    def test_is_allowed_with_operator(self, matcher_backend, rule_type, operator, name, expected):
+        rule = _rule(rule_type, ["python", "django"], operator=operator)
+
+        assert rule.is_allowed(_folder(name)) is expected
+
+    def test_is_allowed_folds_case(self, matcher_backend):
+        rule = _rule(ContainsRule, ["C++", "A.B"])
+
+        assert rule.is_allowed(_folder("My-c++-Lib")) is True
+        assert rule.is_allowed(_folder("ABB")) is False
+
+    def test_is_allowed_keeps_case_if_sensitive(self, matcher_backend):
+        rule = _rule(ContainsRule, ["Python", "Django"], case_sensitive=True)
+
+        assert rule.is_allowed(_folder("Python-Lib")) is True
+        assert rule.is_allowed(_folder("python-lib")) is False
+
+    @pytest.mark.parametrize(
+        "values, name, expected",
+        [
+            (["python"], "python-lib", True),
+            (["python"], "flask-lib", False),
+            (["python", ""], "flask-lib", True),
+        ],
+    )
+    def test_is_allowed_with_single_or_empty_value(self, matcher_backend, values, name, expected):
+        rule = _rule(ContainsRule, values)
+
+        assert rule.is_allowed(_folder(name)) is expected
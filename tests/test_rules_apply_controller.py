@@ -1,3 +1,4 @@
+import logging
 from unittest.mock import Mock, patch
 
 import pytest
@@ -37,6 +38,7 @@ class TestRulesApplyBuilder:
 
     def test_icon_setting_for_returns_matching_setting(self, builder):
         mock_folder = Mock(spec=Folder)
+        mock_folder.name = "test_folder"
         mock_setting1 = Mock(spec=IconSetting)
         mock_setting1.is_config_for.return_value = False
         mock_setting2 = Mock(spec=IconSetting)
@@ -52,6 +54,7 @@ class TestRulesApplyBuilder:
 
     def test_icon_setting_for_returns_none_when_no_match(self, builder):
         mock_folder = Mock(spec=Folder)
+        mock_folder.name = "test_folder"
         mock_setting = Mock(spec=IconSetting)
         mock_setting.is_config_for.return_value = False
 
@@ -61,6 +64,41 @@ class TestRulesApplyBuilder:
 
         assert result is None
 
+    def test_icon_setting_for_checks_name_settings_once_per_name(self, builder):
+        first = Mock(spec=Folder)
+        first.name = "node_modules"
+        second = Mock(spec=Folder)
+        second.name = "node_modules"
+        mock_setting = Mock(spec=IconSetting)
+        mock_setting.is_name_rule.return_value = True
+        mock_setting.is_config_for.return_value = True
+
+        builder.setup(settings=[mock_setting])
+
+        assert builder.icon_setting_for(first) == mock_setting
+        assert builder.icon_setting_for(second) == mock_setting
+        mock_setting.is_config_for.assert_called_once_with(first)
+
+    def test_icon_setting_for_checks_other_settings_for_every_folder(self, builder):
+        name_setting = Mock(spec=IconSetting)
+        name_setting.is_name_rule.return_value = True
+        name_setting.is_config_for.return_value = False
+        content_setting = Mock(spec=IconSetting)
+        content_setting.is_name_rule.return_value = False
+        content_setting.is_config_for.side_effect = [False, True]
+        folders = []
+        for _ in range(2):
+            folder = Mock(spec=Folder)
+            folder.name = "src"
+            folders.append(folder)
+
+        builder.setup(settings=[name_setting, content_setting])
+
+        assert builder.icon_setting_for(folders[0]) is None
+        assert builder.icon_setting_for(folders[1]) == content_setting
+        name_setting.is_config_for.assert_called_once_with(folders[0])
+        assert content_setting.is_config_for.call_count == 2
+
     def test_get_matched_folder_creates_matched_folder_when_config_found(self, builder):
         mock_folder = Mock(spec=Folder)
         mock_folder.path = "/test/folder"
@@ -109,6 +147,30 @@ class TestRulesApplyBuilder:
             mock_get_matched.assert_called_once_with(mock_folder)
             assert result == mock_matched_folder
 
+    def test_build_models_walks_like_iter_models(self, builder):
+        root = Folder.from_path("/root", None)
+        matched = Folder.from_path("/root/matched", root)
+        excluded = Folder.from_path("/root/excluded", root)
+        excluded.excluded = True
+        unmatched = Folder.from_path("/root/unmatched", root)
+        below_unmatched = Folder.from_path("/root/unmatched/matched", unmatched)
+        unmatched.folders.append(below_unmatched)
+        nested = Folder.from_path("/root/matched/nested", matched)
+        matched.folders.append(nested)
+        root.folders.extend([matched, excluded, unmatched])
+        mock_setting = Mock(spec=IconSetting)
+        mock_setting.is_name_rule.return_value = False
+        mock_setting.is_config_for.side_effect = lambda folder: folder.name != "unmatched"
+        builder.setup(settings=[mock_setting])
+
+        result = builder.build_models([root])
+
+        assert [folder.path for folder in result] == [
+            folder.path for folder in builder.iter_models([root])
+        ]
+        assert [folder.path for folder in result] == ["/root", "/root/matched", "/root/matched/nested"]
+        assert all(folder.setting is mock_setting for folder in result)
+
 
 class TestRulesApplyOptions:
     @pytest.fixture
@@ -215,6 +277,16 @@ class TestRulesApplyController:
         controller.builder.build_models.assert_called_once_with(mock_folders)
         assert controller.folders == mock_matched_folders
 
+    def test_search_and_find_matches_logs_one_summary(self, controller, caplog):
+        controller.builder.build_models.return_value = [Mock(spec=MatchedRuleFolder)] * 3
+
+        with caplog.at_level(logging.INFO, logger="icon_manager.content.controller.rules_apply"):
+            controller.search_and_find_matches([Mock(spec=Folder)], [Mock(spec=IconSetting)])
+
+        messages = [record.getMessage() for record in caplog.records
+                    if record.name == "icon_manager.content.controller.rules_apply"]
+        assert messages == ["Matched 3 folders"]
+
     @patch("icon_manager.content.controller.rules_apply.CreateIconAction")
     def test_creating_found_matches_executes_create_action(self, mock_action_class, controller):
         mock_matched_folders = [Mock(spec=MatchedRuleFolder)]
@@ -258,7 +330,7 @@ class TestRulesApplyController:
         controller.re_apply_matches(mock_re_apply_controller)
 
         mock_action_class.assert_called_once_with(mock_re_apply_controller, controller.user_config)
-        mock_action.execute.assert_called_once()
+        mock_action.async_execute.assert_called_once()
         mock_action.get_log_message.assert_called_once_with(MatchedRuleFolder)
 
     @patch("icon_manager.content.controller.rules_apply.ReCreateIconAction")
@@ -271,7 +343,7 @@ class TestRulesApplyController:
 
         controller.re_apply_matches(mock_re_apply_controller)
 
-        mock_action.execute.assert_called_once()
+        mock_action.async_execute.assert_called_once()
         mock_action.get_log_message.assert_not_called()
 
     def test_delete_content_is_empty_implementation(self, controller):
@@ -1,3 +1,4 @@
+import json
 from typing import Any
 from unittest.mock import Mock, patch
 from uuid import UUID
@@ -12,6 +13,7 @@ from icon_manager.config.user import (
     get_icons_search_folder,
     get_search_folders,
 )
+from icon_manager.data import json_source
 from icon_manager.data.json_source import JsonSource
 from icon_manager.interfaces.path import ConfigFile, IconSearchFolder, SearchFolder
 
@@ -54,8 +56,8 @@ class TestUserConfig:
         with patch("icon_manager.config.user.filters") as mock_filters:
             user_config.validate()
 
-            assert mock_filters.EXCLUDED_FOLDERS == ["exclude1", "exclude2"]
-            assert mock_filters.PROJECT_FOLDERS == ["code1", "code2"]
+            assert mock_filters.EXCLUDED_FOLDERS == frozenset({"exclude1", "exclude2"})
+            assert mock_filters.PROJECT_FOLDERS == frozenset({"code1", "code2"})
 
     def test_has_search_folders_returns_true_when_folders_exist(self, user_config):
         assert user_config.has_search_folders() is True
@@ -76,20 +78,26 @@ class TestUserConfig:
 
     def test_search_folder_by_returns_matching_folder(self, user_config, mock_search_folders):
         mock_entry = Mock()
-        mock_search_folders[0].is_path_entry.return_value = False
-        mock_search_folders[1].is_path_entry.return_value = True
+        mock_entry.path = "/test/search2/folder"
 
         result = user_config.search_folder_by(mock_entry)
 
         assert result == mock_search_folders[1]
-        mock_search_folders[0].is_path_entry.assert_called_once_with(mock_entry)
-        mock_search_folders[1].is_path_entry.assert_called_once_with(mock_entry)
+
+    def test_search_folder_by_prefers_nested_search_folder(self, user_config, mock_search_folders):
+        nested = Mock(spec=IconSearchFolder)
+        nested.path = "/test/search1/nested"
+        user_config.search_folders = [*mock_search_folders, nested]
+        mock_entry = Mock()
+        mock_entry.path = "/test/search1/nested/folder"
+
+        result = user_config.search_folder_by(mock_entry)
+
+        assert result == nested
 
     def test_search_folder_by_raises_error_when_no_match(self, user_config, mock_search_folders):
         mock_entry = Mock()
         mock_entry.path = "/test/unknown"
-        mock_search_folders[0].is_path_entry.return_value = False
-        mock_search_folders[1].is_path_entry.return_value = False
 
         with pytest.raises(ValueError, match="Search folder for /test/unknown not exists"):
             user_config.search_folder_by(mock_entry)
@@ -297,8 +305,31 @@ class TestUserConfigFactory:
 
                 assert result.copy_icon is False
                 assert result.before_or_after == set()
-                assert result.code_folders == []
-                assert result.exclude_folders == []
+                assert result.code_folders == ()
+                assert result.exclude_folders == ()
+
+    def test_create_parses_unchanged_config_file_once(self, tmp_path):
+        config_path = tmp_path / "user.config"
+        config_path.write_text(
+            json.dumps(
+                {
+                    UserConfigs.CONFIG_SECTION: {
+                        UserConfigs.ICONS_PATH: str(tmp_path),
+                        UserConfigs.SEARCH_FOLDERS: [{UserConfigs.SEARCH_PATH: str(tmp_path)}],
+                    }
+                }
+            )
+        )
+        factory = UserConfigFactory(JsonSource())
+
+        with patch.object(json_source, "_loads", wraps=json_source._loads) as mock_loads:
+            factory.create(ConfigFile(str(config_path)))
+            factory.create(ConfigFile(str(config_path)))
+            factory.prepare_template(ConfigFile(str(config_path)))
+            content = factory.source.read(ConfigFile(str(config_path)))
+
+        assert mock_loads.call_count == 2
+        assert content[UserConfigs.CONFIG_SECTION][UserConfigs.SEARCH_FOLDERS] == []
 
     def test_copy_user_config_template_copies_template(self, factory):
         mock_config = Mock(spec=ConfigFile)
@@ -336,6 +367,22 @@ class TestUserConfigFactory:
         assert config_section[UserConfigs.COPY_ICONS] is False
         assert "other_config" in config_section
 
+    def test_prepare_template_drops_values_without_empty_value(self, factory):
+        mock_config = Mock(spec=ConfigFile)
+
+        factory.source.read.return_value = {
+            UserConfigs.CONFIG_SECTION: {
+                UserConfigs.ICONS_PATH: None,
+                UserConfigs.SEARCH_FOLDERS: {"path": "/test"},
+                UserConfigs.COPY_ICONS: True,
+            }
+        }
+
+        factory.prepare_template(mock_config)
+
+        write_call_args = factory.source.write.call_args[0][1]
+        assert write_call_args[UserConfigs.CONFIG_SECTION] == {UserConfigs.COPY_ICONS: False}
+
     def test_prepare_template_raises_error_when_content_none(self, factory):
         mock_config = Mock(spec=ConfigFile)
         factory.source.read.return_value = None